@@ -1,10 +1,7 @@
-import sys
 import os
 import time
 import pytest
 
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-
 from backup_handler import BackupHandler
 
 @pytest.fixture
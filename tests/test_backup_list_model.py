@@ -0,0 +1,66 @@
+"""
+Tests for the BackupListModel, which backs the backup list view.
+"""
+
+import pytest
+
+from ui.backup_list_model import BackupListModel
+
+@pytest.fixture
+def list_model(qapp):
+    """Provides a list model showing two backups, most recent first."""
+    model = BackupListModel()
+    model.set_rows(["backup_b.bak", "backup_a.bak"], [2000, 1000])
+    return model
+
+def rows(model):
+    """Helper function to read every row of the model."""
+    return [model.index(row).data() for row in range(model.rowCount())]
+
+@pytest.mark.parametrize("mtime, expected", [
+    (3000, ["backup_new.bak", "backup_b.bak", "backup_a.bak"]),
+    (1500, ["backup_b.bak", "backup_new.bak", "backup_a.bak"]),
+    (500, ["backup_b.bak", "backup_a.bak", "backup_new.bak"]),
+], ids=["newest", "middle", "oldest"])
+def test_insert_backup_keeps_rows_sorted(list_model, mtime, expected):
+    """Tests that an inserted backup lands at its sorted position."""
+    list_model.insert_backup("backup_new.bak", mtime)
+    assert rows(list_model) == expected
+
+def test_insert_backup_inserts_single_row(list_model, qtbot):
+    """Tests that an insert signals a single row rather than a model reset."""
+    with qtbot.waitSignal(list_model.rowsInserted) as blocker:
+        list_model.insert_backup("backup_new.bak", 1500)
+    assert blocker.args[1:] == [1, 1]
+
+def test_remove_backup(list_model):
+    """Tests that a removed backup disappears and unknown backups are ignored."""
+    list_model.remove_backup("backup_b.bak")
+    list_model.remove_backup("not_on_display.bak")
+    assert rows(list_model) == ["backup_a.bak"]
+
+@pytest.mark.parametrize("new_rows, new_mtimes, signal", [
+    (["backup_b.bak", "backup_a.bak"], [2000, 1000], None),
+    (["backup_b.bak", "backup_a.bak"], [1800, 1200], None),
+    (["backup_new.bak", "backup_b.bak", "backup_a.bak"], [3000, 2000, 1000], "rowsInserted"),
+    (["backup_b.bak"], [2000], "rowsRemoved"),
+    (["backup_a.bak"], [1000], "rowsRemoved"),
+], ids=["unchanged", "mtimes_updated", "prepended", "trailing_removed", "leading_removed"])
+def test_set_rows_avoids_model_reset(list_model, qtbot, new_rows, new_mtimes, signal):
+    """Tests that small changes to the displayed rows do not reset the whole model."""
+    with qtbot.assertNotEmitted(list_model.modelReset):
+        if signal:
+            with qtbot.waitSignal(getattr(list_model, signal)):
+                list_model.set_rows(new_rows, new_mtimes)
+        else:
+            list_model.set_rows(new_rows, new_mtimes)
+    assert rows(list_model) == new_rows
+
+def test_set_rows_picks_up_updated_mtimes(qapp):
+    """Tests that backups listed before their modification times were read are re-sorted once they are."""
+    model = BackupListModel()
+    model.set_rows(["c", "b", "a"], [0.0, 0.0, 0.0])
+    model.set_rows(["c", "b", "a"], [300, 200, 100])
+
+    model.insert_backup("old", 150)
+    assert rows(model) == ["c", "b", "old", "a"]
@@ -1,10 +1,7 @@
-import sys
 import os
 import json
 import pytest
 
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-
 from config import ConfigManager
 
 # Mock the QMessageBox to prevent GUI popups during tests
@@ -2,25 +2,25 @@
 Tests for edge cases and error handling scenarios.
 """
 
-import sys
 import os
 import pytest
 import time
-from unittest.mock import MagicMock, patch
-
-# Add project root to the path
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from unittest.mock import MagicMock, Mock, patch
 
+from config import ConfigManager
+from services import BackupService
+from startup_manager import StartupManager
 from ui.main_window import Sims4RewindApp
+from ui.view_model import BackupViewModel
 from backup_handler import BackupHandler
 
 @pytest.fixture
 def app(qtbot, mocker):
     """A fixture that creates the main application window with mocked dependencies."""
-    mock_config = MagicMock()
-    mock_service = MagicMock()
-    mock_view_model = MagicMock()
-    mock_startup = MagicMock()
+    mock_config = Mock(spec=ConfigManager)
+    mock_service = Mock(spec=BackupService)
+    mock_view_model = Mock(spec=BackupViewModel)
+    mock_startup = Mock(spec=StartupManager)
 
     # Configure the mock config manager to return a dictionary with default values
     mock_settings = {
@@ -54,8 +54,8 @@ def test_restore_io_error_handling(mock_dialogs, app):
     # Configure the UI state for the test
     main_app.ui.saves_folder_path.setText("D:/dummy/saves")
     main_app.ui.backup_folder_path.setText("D:/dummy/backups")
-    main_app.ui.backup_list_widget.addItem("Slot_00000001.save_2023-01-01_12-00-00.bak")
-    main_app.ui.backup_list_widget.setCurrentRow(0)
+    main_app.backup_list_model.set_rows(["Slot_00000001.save_2023-01-01_12-00-00.bak"], [0.0])
+    main_app.ui.backup_list_widget.setCurrentIndex(main_app.backup_list_model.index(0))
 
     # Mock the confirmation dialog to return 'Yes'
     mock_dialogs.ask_question.return_value = True
@@ -1,10 +1,6 @@
 import sys
-import os
 import pytest
 
-# Add project root to the path
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-
 from startup_manager import StartupManager
 
 # Mock the entire win32com.client module for non-Windows environments or to avoid side-effects
@@ -3,20 +3,11 @@
 # =====================================================================
 # This file contains the unit tests for the SystemTrayIcon class.
 
-import sys
-import os
 import pytest
 from unittest.mock import MagicMock
-from PyQt6.QtWidgets import QApplication
 
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 from system_tray import SystemTrayIcon
 
-@pytest.fixture(scope="module")
-def qapp():
-    """Ensures a QApplication instance exists for the test module."""
-    return QApplication.instance() or QApplication(sys.argv)
-
 @pytest.fixture
 def mock_window():
     """Provides a MagicMock for the main window with necessary attributes."""
@@ -3,54 +3,102 @@ Tests for the UI interactions in the main window.
 These tests use mock objects to isolate the UI from the backend services.
 """
 
-import sys
 import os
 import pytest
-from unittest.mock import MagicMock
-
-# Add project root to the path to allow imports from the 'ui' package
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-
+from types import SimpleNamespace
+from unittest.mock import Mock
+from PyQt6.QtCore import QModelIndex
+
+from config import ConfigManager
+from services import BackupService
+from startup_manager import StartupManager
+from ui.dialogs import FILE_DIALOG_OPTIONS
 from ui.main_window import Sims4RewindApp
-
-@pytest.fixture
-def app(qtbot, mocker):
+from ui.view_model import BackupViewModel
+
+# Stands in for the ui.dialogs module so no real dialogs open during tests.
+_FAKE_DIALOGS = SimpleNamespace(
+    browse_for_directory=Mock(),
+    show_info=Mock(),
+    show_warning=Mock(),
+    show_critical=Mock(),
+    ask_question=Mock(return_value=True),
+    ask_minimize_or_exit=Mock(return_value="minimize")
+)
+
+def select_backup(main_app, backup_filename):
+    """Helper function to show a single backup in the list and select it."""
+    main_app.backup_list_model.set_rows([backup_filename], [0.0])
+    main_app.ui.backup_list_widget.setCurrentIndex(main_app.backup_list_model.index(0))
+
+@pytest.fixture(scope="module", params=[False, True], ids=["uncompressed", "compressed"])
+def mock_settings(request):
     """
-    A fixture that creates the main application window with all its dependencies mocked.
-    This allows for isolated testing of the UI's behavior.
+    The settings returned by the mocked config manager. Parametrized so every
+    UI test runs with backup compression both disabled and enabled.
     """
-    # Mock all the dependencies that will be injected into the main window
-    mock_config = MagicMock()
-    mock_service = MagicMock()
-    mock_view_model = MagicMock()
-    mock_startup = MagicMock()
-
-    # Configure the mock config manager to return a dictionary with default values
-    mock_settings = {
+    return {
         "saves_folder": "D:/dummy/saves",
         "backup_folder": "D:/dummy/backups",
         "backup_count": 5,
         "auto_monitor_on_startup": False,
-        "compress_backups": False
+        "compress_backups": request.param
     }
+
+@pytest.fixture(scope="module")
+def app(qapp, mock_settings):
+    """
+    A fixture that creates the main application window with all its dependencies mocked.
+    This allows for isolated testing of the UI's behavior.
+
+    The window is built once per module (and settings variant) because widget
+    construction dominates the runtime of these tests; `reset_ui` restores the
+    mutable state between tests.
+    """
+    # Mock all the dependencies that will be injected into the main window
+    mock_config = Mock(spec=ConfigManager)
+    mock_service = Mock(spec=BackupService)
+    mock_view_model = Mock(spec=BackupViewModel)
+    mock_startup = Mock(spec=StartupManager)
+
+    # Configure the mock config manager to return the parametrized settings
     mock_config.load_settings.return_value = mock_settings
     mock_startup.is_enabled.return_value = False
 
-    # Patch the dialogs module to prevent real dialogs from opening during tests.
-    mocker.patch('ui.main_window.dialogs')
-
-    # Create the application instance with the mocked dependencies
-    test_app = Sims4RewindApp(
-        config_manager=mock_config,
-        backup_service=mock_service,
-        backup_view_model=mock_view_model,
-        startup_manager=mock_startup
-    )
-    test_app.set_dependencies_and_connect_signals(mock_config, mock_service) # Connect signals
-    qtbot.addWidget(test_app)
+    # Swap in the fake dialogs to prevent real dialogs from opening during tests.
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr('ui.main_window.dialogs', _FAKE_DIALOGS)
+
+        # Create the application instance with the mocked dependencies
+        test_app = Sims4RewindApp(
+            config_manager=mock_config,
+            backup_service=mock_service,
+            backup_view_model=mock_view_model,
+            startup_manager=mock_startup
+        )
+        test_app.set_dependencies_and_connect_signals(mock_config, mock_service) # Connect signals
+
+        # Yield the app and the mocks so tests can use them
+        yield test_app, mock_config, mock_service, mock_view_model, mock_startup
+
+        test_app.close()
+        test_app.deleteLater()
+
+@pytest.fixture(autouse=True)
+def reset_ui(app):
+    """Resets the widget state and mock call history left behind by the previous test."""
+    main_app, mock_config, mock_service, mock_view_model, mock_startup = app
+    main_app.backup_list_model.set_rows([], [])
+    main_app.ui.toggle_monitoring_button.setChecked(False)
+    main_app.ui.toggle_monitoring_button.setText("Start Monitoring")
+    main_app.ui.log_text_edit.clear()
+    for mock in (mock_config, mock_service, mock_view_model, mock_startup, *vars(_FAKE_DIALOGS).values()):
+        mock.reset_mock()
 
-    # Return the app and the mocks so tests can use them
-    return test_app, mock_config, mock_service, mock_view_model, mock_startup
+def test_compress_checkbox_reflects_settings(app, mock_settings):
+    """Tests that the compression checkbox is loaded from the saved settings."""
+    main_app, _, _, _, _ = app
+    assert main_app.ui.compress_backups_checkbox.isChecked() == mock_settings["compress_backups"]
 
 def test_restore_button_initially_disabled(app):
     """Tests that the Restore button is disabled when no backup is selected."""
@@ -63,13 +111,12 @@ def test_restore_button_toggles_with_selection(app, qtbot):
     assert not main_app.ui.restore_button.isEnabled()
 
     # Simulate selecting an item in the list
-    main_app.ui.backup_list_widget.addItem("backup_item_1")
-    main_app.ui.backup_list_widget.setCurrentRow(0)
+    select_backup(main_app, "backup_item_1")
     
     assert main_app.ui.restore_button.isEnabled()
 
     # Simulate deselecting an item
-    main_app.ui.backup_list_widget.setCurrentRow(-1)
+    main_app.ui.backup_list_widget.setCurrentIndex(QModelIndex())
     assert not main_app.ui.restore_button.isEnabled()
 
 def test_monitoring_button_toggles_service(app):
@@ -90,21 +137,19 @@ def test_ui_updates_on_service_signal(app, qtbot):
 
     # Simulate the service starting monitoring on its own by directly calling the slot
     main_app._on_monitoring_status_changed(True)
-    qtbot.wait(10) # Allow event loop to process UI updates
-    assert "Stop Monitoring" in main_app.ui.toggle_monitoring_button.text()
+    # Returns as soon as the UI has been updated instead of sleeping a fixed time
+    qtbot.waitUntil(lambda: "Stop Monitoring" in main_app.ui.toggle_monitoring_button.text(), timeout=100)
 
     # Simulate the service stopping monitoring by directly calling the slot
     main_app._on_monitoring_status_changed(False)
-    qtbot.wait(10) # Allow event loop to process UI updates
-    assert "Start Monitoring" in main_app.ui.toggle_monitoring_button.text()
+    qtbot.waitUntil(lambda: "Start Monitoring" in main_app.ui.toggle_monitoring_button.text(), timeout=100)
 
 def test_restore_to_location(app, mocker):
     """Tests that restoring to a new location works correctly."""
     main_app, _, _, _, _ = app
 
     # Simulate selecting a backup item
-    main_app.ui.backup_list_widget.addItem("Slot_00000001.save_2023-01-01_12-00-00.bak")
-    main_app.ui.backup_list_widget.setCurrentRow(0)
+    select_backup(main_app, "Slot_00000001.save_2023-01-01_12-00-00.bak")
 
     # Mock QFileDialog.getSaveFileName
     mock_get_save_file_name = mocker.patch('PyQt6.QtWidgets.QFileDialog.getSaveFileName', return_value=("D:/new/location/my_save.save", ""))
@@ -123,7 +168,8 @@ def test_restore_to_location(app, mocker):
 
     # Assertions
     mock_get_save_file_name.assert_called_once_with(
-        main_app, "Save Backup As", "Slot_00000001.save", "All Files (*)"
+        main_app, "Save Backup As", "Slot_00000001.save", "All Files (*)",
+        options=FILE_DIALOG_OPTIONS
     )
     mock_restore_service.assert_called_once_with(
         backup_source_path=os.path.join("D:/test/backups", "Slot_00000001.save_2023-01-01_12-00-00.bak"),
@@ -154,7 +200,7 @@ def test_log_tab_updates(app, qtbot):
 
     test_message = "This is a test log message."
     main_app._update_status_label(test_message)
-    qtbot.wait(10) # Allow event loop to process UI updates
+    qtbot.waitUntil(lambda: test_message in main_app.ui.log_text_edit.toPlainText(), timeout=100)
 
     log_content = main_app.ui.log_text_edit.toPlainText()
     assert test_message in log_content
@@ -162,3 +208,93 @@ def test_log_tab_updates(app, qtbot):
     assert log_content.startswith('[') and log_content.endswith(f'] {test_message}')
     assert len(log_content.split(' ')[0]) == 11 # [YYYY-MM-DD
     assert len(log_content.split(' ')[1]) == 9 # HH:MM:SS]
+
+def test_log_messages_are_batched(app, qtbot, mocker):
+    """Tests that a burst of log messages is written to the log tab in a single append."""
+    main_app, _, _, _, _ = app
+    qtbot.waitUntil(lambda: not main_app._log_flush_timer.isActive(), timeout=100)
+    mock_append = mocker.spy(main_app.ui.log_text_edit, 'appendPlainText')
+
+    with qtbot.waitSignal(main_app._log_flush_timer.timeout, timeout=1000):
+        for i in range(3):
+            main_app._append_log_message(f"Message {i}")
+
+    mock_append.assert_called_once()
+    lines = mock_append.call_args[0][0].split("\n")
+    assert [line.split("] ", 1)[1] for line in lines] == ["Message 0", "Message 1", "Message 2"]
+
+def test_model_updates_are_coalesced(app, qtbot):
+    """Tests that a burst of model updates results in a single list refresh."""
+    main_app, _, _, mock_view_model, _ = app
+    mock_view_model.get_filter_options.return_value = ["Slot_00000001.save"]
+    mock_view_model.get_backups_for_display.return_value = ["Slot_00000001.save_2023-01-01_12-00-00.bak"]
+
+    with qtbot.waitSignal(main_app._refresh_timer.timeout, timeout=1000):
+        for _ in range(3):
+            main_app._on_view_model_updated()
+
+    mock_view_model.get_backups_for_display.assert_called_once()
+    assert main_app.backup_list_model.rowCount() == 1
+
+def test_filter_dropdown_rebuilt_only_when_options_change(app, mocker):
+    """Tests that the filter dropdown keeps its items while the save names are unchanged."""
+    main_app, _, _, mock_view_model, _ = app
+    mock_view_model.get_filter_options.return_value = ["Slot_00000001.save", "Slot_00000002.save"]
+    main_app._populate_filter_dropdown()
+    mock_clear = mocker.spy(main_app.ui.backup_filter_dropdown, 'clear')
+
+    main_app._populate_filter_dropdown()
+    mock_clear.assert_not_called()
+
+    mock_view_model.get_filter_options.return_value = ["Slot_00000001.save"]
+    main_app._populate_filter_dropdown()
+    mock_clear.assert_called_once()
+    assert main_app.ui.backup_filter_dropdown.count() == 2
+
+def test_log_tab_is_bounded(app):
+    """Tests that the log tab discards its oldest lines beyond the maximum line count."""
+    main_app, _, _, _, _ = app
+    log_text_edit = main_app.ui.log_text_edit
+
+    log_text_edit.appendPlainText("\n".join(f"Line {i}" for i in range(2500)))
+
+    assert log_text_edit.blockCount() == 2000
+    assert log_text_edit.toPlainText().startswith("Line 500\n")
+
+def test_settings_saves_are_debounced(app, qtbot):
+    """Tests that a burst of settings changes results in a single write."""
+    main_app, mock_config, _, _, _ = app
+    checkbox = main_app.ui.compress_backups_checkbox
+
+    with qtbot.waitSignal(main_app._settings_save_timer.timeout, timeout=2000):
+        # An even number of toggles leaves the shared window as it was.
+        for _ in range(4):
+            checkbox.setChecked(not checkbox.isChecked())
+        mock_config.save_settings.assert_not_called()
+
+    mock_config.save_settings.assert_called_once()
+    assert mock_config.save_settings.call_args[0][0]["compress_backups"] == checkbox.isChecked()
+
+def test_starting_monitoring_keeps_monitoring_status(app, mocker):
+    """Tests that the settings save on Start does not overwrite the monitoring status."""
+    main_app, mock_config, mock_service, _, _ = app
+    mocker.patch.object(mock_service, "start_monitoring",
+                        side_effect=lambda: main_app._on_monitoring_status_changed(True))
+
+    main_app.ui.toggle_monitoring_button.setChecked(True)
+
+    mock_config.save_settings.assert_called_once()
+    # No debounced save is left pending that could overwrite the status later.
+    assert not main_app._settings_save_timer.isActive()
+    assert main_app.ui.status_label.text() == "Status: Monitoring active."
+
+def test_browsed_path_shows_its_start(app):
+    """Tests that a long browsed-to path is shown from its beginning."""
+    main_app, _, _, _, _ = app
+    long_path = "D:/" + "/".join(["Electronic Arts", "The Sims 4", "saves"] * 10)
+    _FAKE_DIALOGS.browse_for_directory.return_value = long_path
+
+    main_app._browse_saves_folder()
+
+    assert main_app.ui.saves_folder_path.text() == long_path
+    assert main_app.ui.saves_folder_path.cursorPosition() == 0
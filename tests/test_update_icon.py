@@ -0,0 +1,18 @@
+import pytest
+
+from update_icon import working_size
+
+@pytest.mark.parametrize("image_size, expected", [
+    # A large square source is fitted into the working size
+    ((2048, 2048), (512, 512)),
+    # Wide and tall sources keep their shorter side at the largest icon size
+    ((1000, 300), (853, 256)),
+    ((300, 1000), (256, 853)),
+    # A source whose shorter side is already the largest icon size is left alone
+    ((256, 256), (256, 256)),
+    # Small sources are never enlarged
+    ((100, 50), (100, 50)),
+], ids=["large_square", "wide", "tall", "exact", "small"])
+def test_working_size(image_size, expected):
+    """Tests that scaling a source image down never drops the largest icon size."""
+    assert working_size(image_size) == expected
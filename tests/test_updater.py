@@ -1,260 +1,252 @@
-
-import unittest
-from unittest.mock import patch, MagicMock, mock_open
+import hashlib
 import os
 import sys
-import tempfile
-import shutil
-import zipfile
-import requests
-
-# Add the project root to the path to allow importing the updater modules
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import pytest
+from dataclasses import dataclass, field
+from typing import Final
+from unittest.mock import MagicMock, mock_open
 
 from private_update.updater_google_drive import GoogleDriveUpdater
 from private_update import version as local_version
 from private_update import updater_config
 from private_update.updater import perform_update
 
-class TestUpdaterCore(unittest.TestCase):
-
-    def setUp(self):
-        """Create a temporary directory structure to simulate an app installation."""
-        self.test_dir = tempfile.mkdtemp()
-        self.app_dir = os.path.join(self.test_dir, 'Sims4Rewind')
-        self.zip_dir = os.path.join(self.test_dir, 'zip_location')
-        os.makedirs(self.app_dir)
-        os.makedirs(self.zip_dir)
-
-        # Create a dummy application file
-        with open(os.path.join(self.app_dir, 'Sims4Rewind.exe'), 'w') as f:
-            f.write('old version')
-
-        # Create a dummy update zip
-        self.zip_path = os.path.join(self.zip_dir, 'update.zip')
-        with zipfile.ZipFile(self.zip_path, 'w') as zf:
-            zf.writestr('Sims4Rewind.exe', 'new version')
-            zf.writestr('new_file.txt', 'a new file')
-
-    def tearDown(self):
-        """Clean up the temporary directory."""
-        shutil.rmtree(self.test_dir)
-
-    def test_perform_update_success(self):
-        """Test the entire update process in a simulated environment."""
-        mock_log = MagicMock()
-        
-        # --- Execution ---
-        success, _ = perform_update(
-            downloaded_zip_path=self.zip_path,
-            app_install_dir=self.app_dir,
-            executable_name='Sims4Rewind.exe',
-            log_func=mock_log
-        )
-
-        # --- Assertions ---
-        self.assertTrue(success)
-        
-        # Verify new files are in place
-        self.assertTrue(os.path.exists(os.path.join(self.app_dir, 'Sims4Rewind.exe')))
-        self.assertTrue(os.path.exists(os.path.join(self.app_dir, 'new_file.txt')))
-
-        # Verify the content of the updated file
-        with open(os.path.join(self.app_dir, 'Sims4Rewind.exe'), 'r') as f:
-            self.assertEqual(f.read(), 'new version')
-
-        # Verify the old backup directory was cleaned up
-        self.assertFalse(os.path.exists(self.app_dir + '_old'))
-        
-        # Verify the zip file was cleaned up
-        self.assertFalse(os.path.exists(self.zip_path))
-
-        mock_log.assert_any_call("Updater: Cleaning up temporary files and old app backup.")
-
-
-class TestGoogleDriveUpdater(unittest.TestCase):
-
-    def setUp(self):
-        """Set up a fresh updater instance for each test."""
-        self.log_callback = MagicMock()
-        self.updater = GoogleDriveUpdater(log_callback=self.log_callback)
-        # Mock the User-Agent
-        self.updater.user_agent = "Test-Agent/1.0"
-        self.headers = {'User-Agent': self.updater.user_agent}
-
-    def tearDown(self):
-        """Clean up after each test."""
-        # Ensure the SIGNATURE_TXT_URL is reset to its original value
-        # This is important if a test modifies it (e.g., test_check_for_update_placeholder_url)
-        updater_config.SIGNATURE_TXT_URL = "https://drive.google.com/uc?export=download&id=PLACEHOLDER_SIGNATURE_ID"
-
-    @patch('private_update.updater_google_drive.requests.get')
-    @patch('private_update.updater_google_drive.SIGNATURE_TXT_URL', "https://example.com/signature.txt")
-    def test_check_for_update_new_version_available(self, mock_get):
-        """Test that a new version is correctly detected."""
-        mock_response = MagicMock()
-        mock_response.text = "99.9.9"
-        mock_response.raise_for_status.return_value = None
-        mock_get.return_value = mock_response
-
-        local_version.__version__ = "1.0.0" # Ensure local version is lower
-
-        update_available, latest_version = self.updater.check_for_update()
-
-        self.assertTrue(update_available)
-        self.assertEqual(latest_version, "99.9.9")
-        mock_get.assert_called_once_with(updater_config.VERSION_TXT_URL, headers=self.headers)
-        self.log_callback.assert_any_call("New version 99.9.9 available!")
-
-    @patch('private_update.updater_google_drive.requests.get')
-    @patch('private_update.updater_google_drive.SIGNATURE_TXT_URL', "https://example.com/signature.txt")
-    def test_check_for_update_no_new_version(self, mock_get):
-        """Test that no update is detected when versions are the same."""
-        mock_response = MagicMock()
-        mock_response.text = "1.0.0"
-        mock_response.raise_for_status.return_value = None
-        mock_get.return_value = mock_response
-
-        local_version.__version__ = "1.0.0"
-
-        update_available, latest_version = self.updater.check_for_update()
-
-        self.assertFalse(update_available)
-        self.assertEqual(latest_version, "1.0.0")
-        self.log_callback.assert_any_call("No new updates available.")
-
-    @patch('private_update.updater_google_drive.requests.get')
-    @patch('private_update.updater_google_drive.SIGNATURE_TXT_URL', "https://example.com/signature.txt")
-    def test_check_for_update_network_error(self, mock_get):
-        """Test that network errors are handled gracefully."""
-        mock_get.side_effect = requests.exceptions.RequestException("Network Error")
-
-        update_available, latest_version = self.updater.check_for_update()
-
-        self.assertFalse(update_available)
-        self.log_callback.assert_any_call("Error checking for updates: Network Error")
-
-    def test_check_for_update_placeholder_url(self):
-        """Test that the update check is skipped if the URL is a placeholder."""
-        original_url = updater_config.SIGNATURE_TXT_URL
-        updater_config.SIGNATURE_TXT_URL = "PLACEHOLDER"
-        
-        update_available, _ = self.updater.check_for_update()
-        
-        self.assertFalse(update_available)
-        self.log_callback.assert_called_with("Update check skipped: Updater is not configured (placeholder URL found).")
-        
-        # Restore original value
-        updater_config.SIGNATURE_TXT_URL = original_url
-
-    @patch('private_update.updater_google_drive.crypto_utils')
-    @patch('private_update.updater_google_drive.requests.get')
-    @patch('private_update.updater_google_drive.SIGNATURE_TXT_URL', "https://example.com/signature.txt")
-    @patch('builtins.open', new_callable=mock_open)
-    def test_download_update_success(self, mock_open_file, mock_get, mock_crypto_utils):
-        """Test the successful download and verification of an update."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            # --- Mock Setup ---
-            mock_zip_content = b'zip_file_content'
-            mock_hash_content = 'd3add13d87f6a4427812a6273382731009ed8422f5048e4855329258b3364039' # sha256 of 'zip_file_content'
-            mock_sig_content = b'signature'
-
-            # Mock the responses for zip, hash, and signature
-            mock_zip_response = MagicMock()
-            mock_zip_response.iter_content.return_value = [mock_zip_content]
-            mock_zip_response.raise_for_status.return_value = None
-
-            mock_hash_response = MagicMock()
-            mock_hash_response.text = mock_hash_content
-            mock_hash_response.raise_for_status.return_value = None
-            
-            mock_sig_response = MagicMock()
-            mock_sig_response.content = mock_sig_content
-            mock_sig_response.raise_for_status.return_value = None
-
-            mock_get.side_effect = [
-                mock_zip_response,
-                mock_hash_response,
-                mock_sig_response
-            ]
-            
-            mock_crypto_utils.verify_signature.return_value = True
-            
-            # Mock _calculate_file_hash
-            with patch.object(self.updater, '_calculate_file_hash', return_value=mock_hash_content):
-                # Mock os.path.exists for the public key
-                def mock_os_path_exists(path):
-                    if "public_key.pem" in path:
-                        return True
-                    return False
-
-                with patch('os.path.exists', side_effect=mock_os_path_exists):
-                    # --- Execution ---
-                    result_path = self.updater.download_update(temp_dir=temp_dir)
-
-            # --- Assertions ---
-            self.assertIsNotNone(result_path)
-            self.assertTrue(result_path.endswith('.zip'))
-            
-            # Check that the downloaded file has the correct content
-            # This assertion now relies on mock_open_file capturing the write
-            mock_open_file.assert_any_call(os.path.join(temp_dir, "Sims4Rewind_update.zip"), 'wb')
-            mock_open_file().write.assert_any_call(mock_zip_content)
-        
-            mock_crypto_utils.verify_signature.assert_called_once()
-            self.log_callback.assert_any_call("Signature verification successful.")
-
-    @patch('private_update.updater_google_drive.requests.get')
-    def test_download_update_hash_mismatch(self, mock_get):
-        """Test that a download fails if the hash does not match."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            # --- Mock Setup ---
-            mock_zip_content = b'zip_file_content'
-            mock_hash_content = 'incorrect_hash' # Deliberately wrong hash
-
-            mock_zip_response = MagicMock()
-            mock_zip_response.iter_content.return_value = [mock_zip_content]
-            mock_zip_response.raise_for_status.return_value = None
-
-            mock_hash_response = MagicMock()
-            mock_hash_response.text = mock_hash_content
-            mock_hash_response.raise_for_status.return_value = None
-
-            mock_get.side_effect = [mock_zip_response, mock_hash_response]
-
-            # --- Execution ---
-            result_path = self.updater.download_update(temp_dir=temp_dir)
-
-            # --- Assertions ---
-            self.assertIsNone(result_path)
-            self.log_callback.assert_any_call("Hash verification failed! Downloaded file may be corrupted or tampered with.")
-
-    @patch('subprocess.Popen')
-    @patch('shutil.copy2')
-    @patch('tempfile.mkdtemp')
-    def test_install_update_launches_correctly(self, mock_mkdtemp, mock_copy, mock_popen):
-        """Test that the installer script is launched with the correct arguments."""
-        # --- Mock Setup ---
-        fake_temp_dir = "/tmp/updater123"
-        mock_mkdtemp.return_value = fake_temp_dir
-        
-        # --- Execution ---
-        # Assume we are running from a source file
-        with patch('sys.frozen', False, create=True):
-            self.updater.install_update("/path/to/update.zip")
-
-        # --- Assertions ---
-        mock_copy.assert_called_once()
-        mock_popen.assert_called_once()
-        
-        # Check the arguments passed to Popen
-        popen_args = mock_popen.call_args[0][0]
-        self.assertEqual(popen_args[0], sys.executable)
-        self.assertEqual(popen_args[1], os.path.join(fake_temp_dir, 'updater.py'))
-        self.assertEqual(popen_args[2], '/path/to/update.zip')
-        self.assertTrue(os.path.isabs(popen_args[3])) # app_install_dir
-        self.assertEqual(popen_args[4], 'app.py') # executable_name
-
-if __name__ == '__main__':
-    unittest.main()
-
+@dataclass
+class FakeResponse:
+    """A minimal stand-in for a requests response whose status check always passes."""
+    text: str = ""
+    content: bytes = b""
+    chunks: list = field(default_factory=list)
+
+    def raise_for_status(self):
+        pass
+
+    def iter_content(self, chunk_size=1, decode_unicode=False):
+        return iter(self.chunks)
+
+# --- Updater core fixtures ---
+
+@pytest.fixture
+def app_install_dir(tmp_path):
+    """Creates a temporary directory that simulates an app installation."""
+    app_dir = tmp_path / 'Sims4Rewind'
+    app_dir.mkdir()
+
+    # Create a dummy application file
+    (app_dir / 'Sims4Rewind.exe').write_text('old version')
+    return app_dir
+
+@pytest.fixture(scope="session")
+def template_zip_bytes():
+    """
+    Builds the dummy update zip in memory once. The archive is stored without
+    compression since the payload is tiny and only needs to be extractable.
+    """
+    import io
+    import zipfile
+
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w', compression=zipfile.ZIP_STORED) as zf:
+        zf.writestr('Sims4Rewind.exe', 'new version')
+        zf.writestr('new_file.txt', 'a new file')
+    return buffer.getvalue()
+
+@pytest.fixture
+def update_zip(tmp_path, template_zip_bytes):
+    """
+    Writes a per-test copy of the dummy update zip, since perform_update
+    deletes the zip once it has been applied.
+    """
+    zip_dir = tmp_path / 'zip_location'
+    zip_dir.mkdir()
+    zip_path = zip_dir / 'update.zip'
+    zip_path.write_bytes(template_zip_bytes)
+    return zip_path
+
+def test_perform_update_success(app_install_dir, update_zip):
+    """Test the entire update process in a simulated environment."""
+    mock_log = MagicMock()
+
+    # --- Execution ---
+    success, _ = perform_update(
+        downloaded_zip_path=str(update_zip),
+        app_install_dir=str(app_install_dir),
+        executable_name='Sims4Rewind.exe',
+        log_func=mock_log
+    )
+
+    # --- Assertions ---
+    assert success
+
+    # Verify new files are in place
+    assert (app_install_dir / 'Sims4Rewind.exe').exists()
+    assert (app_install_dir / 'new_file.txt').exists()
+
+    # Verify the content of the updated file
+    assert (app_install_dir / 'Sims4Rewind.exe').read_text() == 'new version'
+
+    # Verify the old backup directory was cleaned up
+    assert not os.path.exists(str(app_install_dir) + '_old')
+
+    # Verify the zip file was cleaned up
+    assert not update_zip.exists()
+
+    mock_log.assert_any_call("Updater: Cleaning up temporary files and old app backup.")
+
+# --- Google Drive updater fixtures ---
+
+@pytest.fixture
+def log_callback():
+    """Provides a mock log callback for the updater."""
+    return MagicMock()
+
+@pytest.fixture
+def updater(log_callback):
+    """Provides a fresh updater instance with a fixed User-Agent."""
+    updater = GoogleDriveUpdater(log_callback=log_callback)
+    updater.user_agent = "Test-Agent/1.0"
+    return updater
+
+@pytest.fixture
+def mock_get(monkeypatch):
+    """Replaces requests.get inside the updater module."""
+    mock = MagicMock()
+    monkeypatch.setattr('private_update.updater_google_drive.requests.get', mock)
+    return mock
+
+@pytest.fixture
+def signature_url(monkeypatch):
+    """Points the signature URL at a non-placeholder value for the test."""
+    monkeypatch.setattr('private_update.updater_google_drive.SIGNATURE_TXT_URL', "https://example.com/signature.txt")
+
+def test_check_for_update_new_version_available(updater, log_callback, mock_get, signature_url, monkeypatch):
+    """Test that a new version is correctly detected."""
+    mock_get.return_value = FakeResponse(text="99.9.9")
+
+    monkeypatch.setattr(local_version, '__version__', "1.0.0") # Ensure local version is lower
+
+    update_available, latest_version = updater.check_for_update()
+
+    assert update_available
+    assert latest_version == "99.9.9"
+    mock_get.assert_called_once_with(updater_config.VERSION_TXT_URL, headers={'User-Agent': updater.user_agent})
+    log_callback.assert_any_call("New version 99.9.9 available!")
+
+def test_check_for_update_no_new_version(updater, log_callback, mock_get, signature_url, monkeypatch):
+    """Test that no update is detected when versions are the same."""
+    mock_get.return_value = FakeResponse(text="1.0.0")
+
+    monkeypatch.setattr(local_version, '__version__', "1.0.0")
+
+    update_available, latest_version = updater.check_for_update()
+
+    assert not update_available
+    assert latest_version == "1.0.0"
+    log_callback.assert_any_call("No new updates available.")
+
+def test_check_for_update_network_error(updater, log_callback, mock_get, signature_url):
+    """Test that network errors are handled gracefully."""
+    import requests
+
+    mock_get.side_effect = requests.exceptions.RequestException("Network Error")
+
+    update_available, latest_version = updater.check_for_update()
+
+    assert not update_available
+    log_callback.assert_any_call("Error checking for updates: Network Error")
+
+def test_check_for_update_placeholder_url(updater, log_callback, monkeypatch):
+    """Test that the update check is skipped if the URL is a placeholder."""
+    monkeypatch.setattr(updater_config, 'SIGNATURE_TXT_URL', "PLACEHOLDER")
+
+    update_available, _ = updater.check_for_update()
+
+    assert not update_available
+    log_callback.assert_called_with("Update check skipped: Updater is not configured (placeholder URL found).")
+
+# The download tests only read from these, so they are built once per module.
+_ZIP_BYTES: Final = b'zip_file_content'
+_ZIP_SHA256: Final = hashlib.sha256(_ZIP_BYTES).hexdigest()
+_ZIP_RESPONSE = FakeResponse(chunks=[_ZIP_BYTES])
+_HASH_RESPONSE = FakeResponse(text=_ZIP_SHA256)
+_SIG_RESPONSE = FakeResponse(content=b'signature')
+
+@pytest.fixture
+def mock_http_responses(mock_get):
+    """Returns a function that queues the responses for successive requests.get calls."""
+    def queue(*responses):
+        mock_get.side_effect = list(responses)
+        return mock_get
+    return queue
+
+def test_download_update_success(updater, log_callback, mock_http_responses, signature_url, monkeypatch, tmp_path):
+    """Test the successful download and verification of an update."""
+    temp_dir = str(tmp_path)
+
+    # --- Mock Setup ---
+    # Responses for zip, hash, and signature, in request order
+    mock_http_responses(_ZIP_RESPONSE, _HASH_RESPONSE, _SIG_RESPONSE)
+
+    mock_crypto_utils = MagicMock()
+    mock_crypto_utils.verify_signature.return_value = True
+    monkeypatch.setattr('private_update.updater_google_drive.crypto_utils', mock_crypto_utils)
+
+    mock_open_file = mock_open()
+    monkeypatch.setattr('builtins.open', mock_open_file)
+    monkeypatch.setattr(updater, '_calculate_file_hash', lambda *args, **kwargs: _ZIP_SHA256)
+    # Only the public key is reported as present on disk
+    monkeypatch.setattr('os.path.exists', lambda path: "public_key.pem" in path)
+
+    # --- Execution ---
+    result_path = updater.download_update(temp_dir=temp_dir)
+
+    # --- Assertions ---
+    assert result_path is not None
+    assert result_path.endswith('.zip')
+
+    # Check that the downloaded file has the correct content
+    # This assertion relies on mock_open_file capturing the write
+    mock_open_file.assert_any_call(os.path.join(temp_dir, "Sims4Rewind_update.zip"), 'wb')
+    mock_open_file().write.assert_any_call(_ZIP_BYTES)
+
+    mock_crypto_utils.verify_signature.assert_called_once()
+    log_callback.assert_any_call("Signature verification successful.")
+
+def test_download_update_hash_mismatch(updater, log_callback, mock_http_responses, tmp_path):
+    """Test that a download fails if the hash does not match."""
+    # --- Mock Setup ---
+    mock_http_responses(_ZIP_RESPONSE, FakeResponse(text='incorrect_hash')) # Deliberately wrong hash
+
+    # --- Execution ---
+    result_path = updater.download_update(temp_dir=str(tmp_path))
+
+    # --- Assertions ---
+    assert result_path is None
+    log_callback.assert_any_call("Hash verification failed! Downloaded file may be corrupted or tampered with.")
+
+def test_install_update_launches_correctly(updater, monkeypatch):
+    """Test that the installer script is launched with the correct arguments."""
+    # --- Mock Setup ---
+    fake_temp_dir = "/tmp/updater123"
+    mock_popen = MagicMock()
+    mock_copy = MagicMock()
+    monkeypatch.setattr('subprocess.Popen', mock_popen)
+    monkeypatch.setattr('shutil.copy2', mock_copy)
+    monkeypatch.setattr('tempfile.mkdtemp', lambda *args, **kwargs: fake_temp_dir)
+    # Assume we are running from a source file
+    monkeypatch.setattr(sys, 'frozen', False, raising=False)
+
+    # --- Execution ---
+    updater.install_update("/path/to/update.zip")
+
+    # --- Assertions ---
+    mock_copy.assert_called_once()
+    mock_popen.assert_called_once()
+
+    # Check the arguments passed to Popen
+    popen_args = mock_popen.call_args[0][0]
+    assert popen_args[0] == sys.executable
+    assert popen_args[1] == os.path.join(fake_temp_dir, 'updater.py')
+    assert popen_args[2] == '/path/to/update.zip'
+    assert os.path.isabs(popen_args[3]) # app_install_dir
+    assert popen_args[4] == 'app.py' # executable_name
@@ -0,0 +1,161 @@
+"""
+Tests for the BackupViewModel, which holds the in-memory state of the backup list.
+"""
+
+import os
+import sys
+import pytest
+
+from ui.view_model import BackupViewModel, read_backup_mtimes, scan_backup_folder
+
+def create_backup(folder, name, mtime):
+    """Helper function to create a backup file with a fixed modification time."""
+    path = folder / name
+    path.write_text("backup data")
+    os.utime(path, (mtime, mtime))
+    return name
+
+@pytest.fixture
+def backup_dir(tmp_path):
+    """A temporary backup folder with three backups across two save files."""
+    create_backup(tmp_path, "Slot_00000001.save_2024-01-01_10-00-00.bak", 1000)
+    create_backup(tmp_path, "Slot_00000001.save_2024-01-02_10-00-00.bak", 3000)
+    create_backup(tmp_path, "Slot_00000002.save_2024-01-01_11-00-00.zip", 2000)
+    (tmp_path / "notes.txt").write_text("not a backup")
+    return tmp_path
+
+@pytest.fixture
+def view_model(qapp):
+    """Provides a fresh view model instance."""
+    return BackupViewModel()
+
+def rescan(view_model, folder, qtbot):
+    """Helper function to rescan a folder and wait for the background scan to finish."""
+    view_model.rescan_backup_folder(str(folder))
+    qtbot.waitUntil(lambda: not view_model.is_rescanning(), timeout=1000)
+
+def test_rescan_groups_backups_by_save(view_model, backup_dir, qtbot):
+    """Tests that a rescan finds every backup and groups it by its save file."""
+    rescan(view_model, backup_dir, qtbot)
+    assert view_model.get_filter_options() == ["Slot_00000001.save", "Slot_00000002.save"]
+
+def test_backups_sorted_newest_first(view_model, backup_dir, qtbot):
+    """Tests that backups are returned most recent first."""
+    rescan(view_model, backup_dir, qtbot)
+    assert view_model.get_backups_for_display("Show All Backups") == [
+        "Slot_00000001.save_2024-01-02_10-00-00.bak",
+        "Slot_00000002.save_2024-01-01_11-00-00.zip",
+        "Slot_00000001.save_2024-01-01_10-00-00.bak",
+    ]
+
+def test_scan_lists_backups_before_reading_mtimes(backup_dir):
+    """Tests that the listing leaves modification times to be read in chunks afterwards."""
+    organized_backups, backup_entries = scan_backup_folder(str(backup_dir))
+    assert organized_backups["Slot_00000002.save"] == {"Slot_00000002.save_2024-01-01_11-00-00.zip": 0.0}
+
+    chunks = list(read_backup_mtimes(backup_entries, chunk_size=2))
+    assert [len(chunk) for chunk in chunks] == [2, 1]
+    assert sorted(mtime for chunk in chunks for _, _, mtime in chunk) == [1000, 2000, 3000]
+
+def test_sorting_does_not_stat_files(view_model, backup_dir, mocker, qtbot):
+    """Tests that the cached scan results are used instead of the filesystem."""
+    rescan(view_model, backup_dir, qtbot)
+    mock_getmtime = mocker.patch("os.path.getmtime")
+    mock_isdir = mocker.patch("os.path.isdir")
+
+    view_model.get_backups_for_display("Slot_00000001.save")
+
+    mock_getmtime.assert_not_called()
+    mock_isdir.assert_not_called()
+
+def test_created_and_pruned_backups_update_model(view_model, backup_dir, qtbot):
+    """Tests that created and pruned backups are reflected without a rescan."""
+    rescan(view_model, backup_dir, qtbot)
+
+    new_backup = create_backup(backup_dir, "Slot_00000003.save_2024-01-03_10-00-00.bak", 4000)
+    view_model.on_backup_created(new_backup)
+    assert view_model.get_backups_for_display("Show All Backups")[0] == new_backup
+
+    view_model.on_backup_pruned(new_backup)
+    assert "Slot_00000003.save" not in view_model.get_filter_options()
+
+def test_created_and_pruned_backups_emit_incremental_signals(view_model, backup_dir, qtbot):
+    """Tests that single-backup changes are signalled individually instead of as a full update."""
+    rescan(view_model, backup_dir, qtbot)
+    new_backup = create_backup(backup_dir, "Slot_00000001.save_2024-01-03_10-00-00.bak", 4000)
+
+    with qtbot.assertNotEmitted(view_model.model_updated):
+        with qtbot.waitSignal(view_model.backup_added) as added:
+            view_model.on_backup_created(new_backup)
+        with qtbot.waitSignal(view_model.backup_removed) as removed:
+            view_model.on_backup_pruned(new_backup)
+
+    assert added.args == [new_backup]
+    assert removed.args == [new_backup]
+    assert view_model.get_backup_mtime(new_backup) == 0.0
+
+def test_rescan_replays_changes_made_during_scan(view_model, backup_dir, qtbot):
+    """Tests that backups created or pruned while a scan is running are not lost."""
+    new_backup = create_backup(backup_dir, "Slot_00000003.save_2024-01-03_10-00-00.bak", 4000)
+    pruned_backup = "Slot_00000002.save_2024-01-01_11-00-00.zip"
+
+    view_model.rescan_backup_folder(str(backup_dir))
+    view_model.on_backup_created(new_backup)
+    view_model.on_backup_pruned(pruned_backup)
+    (backup_dir / pruned_backup).unlink()
+    qtbot.waitUntil(lambda: not view_model.is_rescanning(), timeout=1000)
+
+    assert view_model.get_filter_options() == ["Slot_00000001.save", "Slot_00000003.save"]
+
+def test_rescan_ignores_superseded_scans(view_model, backup_dir, tmp_path_factory, qtbot):
+    """Tests that only the most recently requested folder ends up in the model."""
+    empty_dir = tmp_path_factory.mktemp("empty")
+
+    view_model.rescan_backup_folder(str(backup_dir))
+    view_model.rescan_backup_folder(str(empty_dir))
+    qtbot.waitUntil(lambda: not view_model.is_rescanning(), timeout=1000)
+    qtbot.wait(50)
+
+    assert view_model.get_filter_options() == []
+
+def test_missing_folder_displays_no_backups(view_model, tmp_path, qtbot):
+    """Tests that a backup folder that does not exist results in an empty list."""
+    rescan(view_model, tmp_path / "missing", qtbot)
+    assert view_model.get_backups_for_display("Show All Backups") == []
+
+def test_filter_options_stay_sorted(view_model, backup_dir, qtbot):
+    """Tests that save files added or removed after a rescan keep the filter options sorted."""
+    rescan(view_model, backup_dir, qtbot)
+
+    view_model.on_backup_created(create_backup(backup_dir, "Slot_00000000.save_2024-01-03_10-00-00.bak", 4000))
+    assert view_model.get_filter_options() == ["Slot_00000000.save", "Slot_00000001.save", "Slot_00000002.save"]
+
+    view_model.on_backup_pruned("Slot_00000001.save_2024-01-01_10-00-00.bak")
+    view_model.on_backup_pruned("Slot_00000001.save_2024-01-02_10-00-00.bak")
+    assert view_model.get_filter_options() == ["Slot_00000000.save", "Slot_00000002.save"]
+
+def test_external_changes_are_picked_up(view_model, backup_dir, mocker, qtbot):
+    """Tests that backups added or deleted outside the app are reflected without a rescan."""
+    rescan(view_model, backup_dir, qtbot)
+    # The times of new backups are read with the listing, off the GUI thread.
+    mock_getmtime = mocker.patch("os.path.getmtime")
+
+    with qtbot.waitSignal(view_model.backup_added, timeout=3000) as added:
+        new_backup = create_backup(backup_dir, "Slot_00000003.save_2024-01-03_10-00-00.bak", 4000)
+    assert added.args == [new_backup]
+    assert view_model.get_backup_mtime(new_backup) == 4000
+    mock_getmtime.assert_not_called()
+
+    with qtbot.waitSignal(view_model.backup_removed, timeout=3000) as removed:
+        (backup_dir / new_backup).unlink()
+    assert removed.args == [new_backup]
+    assert "Slot_00000003.save" not in view_model.get_filter_options()
+
+def test_save_names_are_interned(view_model, backup_dir, qtbot):
+    """Tests that backups of the same save share a single save name string."""
+    rescan(view_model, backup_dir, qtbot)
+    # Build the name at runtime so it is not the interned literal.
+    new_backup = "".join(["Slot_00000001.save", "_2024-01-03_10-00-00.bak"])
+    view_model.on_backup_created(create_backup(backup_dir, new_backup, 4000))
+
+    assert view_model.get_filter_options()[0] is sys.intern("Slot_00000001.save")
@@ -0,0 +1,100 @@
+"""
+This module defines the Qt list model behind the backup list view.
+It exposes the backup filenames provided by the ViewModel to a QListView
+without creating a widget item for every row.
+"""
+
+import bisect
+
+from PyQt6.QtCore import QAbstractListModel, QModelIndex, Qt
+
+class BackupListModel(QAbstractListModel):
+    """
+    A read-only list model holding the backup filenames currently on display,
+    most recent first.
+    """
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []
+        # Ascending (mtime, filename) keys; row i holds the key at index
+        # len - 1 - i, so single backups can be placed with a binary search.
+        self._sort_keys = []
+        self._mtimes = {}
+
+    def rowCount(self, parent=QModelIndex()):
+        """Returns the number of backups on display (the list has no children)."""
+        return 0 if parent.isValid() else len(self._rows)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        """Returns the backup filename for the given row."""
+        if role == Qt.ItemDataRole.DisplayRole and index.isValid():
+            return self._rows[index.row()]
+        return None
+
+    def set_rows(self, rows, mtimes):
+        """
+        Replaces the backups on display. The rows must already be sorted most
+        recent first, with mtimes giving each row's modification time.
+        Unchanged rows, or a single row added at the top or removed from either
+        end, are applied without resetting the model; anything else is a
+        single model reset. Changed modification times of the rows already on
+        display are picked up either way.
+        """
+        rows, mtimes = list(rows), list(mtimes)
+        old_rows = self._rows
+        if rows == old_rows:
+            self._update_mtimes(rows, mtimes)
+            return
+        if rows[1:] == old_rows:
+            self._update_mtimes(rows[1:], mtimes[1:])
+            self.insert_backup(rows[0], mtimes[0])
+            return
+        if rows == old_rows[:-1]:
+            self.remove_backup(old_rows[-1])
+            self._update_mtimes(rows, mtimes)
+            return
+        if rows == old_rows[1:]:
+            self.remove_backup(old_rows[0])
+            self._update_mtimes(rows, mtimes)
+            return
+
+        self.beginResetModel()
+        self._rows = rows
+        self._mtimes = dict(zip(rows, mtimes))
+        self._sort_keys = sorted((mtime, name) for name, mtime in self._mtimes.items())
+        self.endResetModel()
+
+    def _update_mtimes(self, rows, mtimes):
+        """
+        Rebuilds the sort keys if the modification times of the rows on display
+        have changed (e.g. once a rescan has read them), without touching the rows.
+        """
+        new_mtimes = dict(zip(rows, mtimes))
+        if new_mtimes != self._mtimes:
+            self._mtimes = new_mtimes
+            self._sort_keys = sorted((mtime, name) for name, mtime in new_mtimes.items())
+
+    def insert_backup(self, filename, mtime):
+        """Inserts a single backup at its sorted position, leaving other rows untouched."""
+        if filename in self._mtimes:
+            return
+        key = (mtime, filename)
+        position = bisect.bisect_left(self._sort_keys, key)
+        row = len(self._sort_keys) - position
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._sort_keys.insert(position, key)
+        self._rows.insert(row, filename)
+        self._mtimes[filename] = mtime
+        self.endInsertRows()
+
+    def remove_backup(self, filename):
+        """Removes a single backup from the list, if it is on display."""
+        if filename not in self._mtimes:
+            return
+        position = bisect.bisect_left(self._sort_keys, (self._mtimes[filename], filename))
+        row = len(self._sort_keys) - 1 - position
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._sort_keys[position]
+        del self._rows[row]
+        del self._mtimes[filename]
+        self.endRemoveRows()
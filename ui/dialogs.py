@@ -5,9 +5,24 @@ like message boxes and file choosers. This keeps the main window code cleaner.
 
 from PyQt6.QtWidgets import QFileDialog, QMessageBox
 
+# Button text, role and resulting action for the "Minimize or Exit?" dialog.
+# The first entry is the default button.
+_MINIMIZE_OR_EXIT_BUTTONS = (
+    ("Minimize to Tray", QMessageBox.ButtonRole.ActionRole, "minimize"),
+    ("Exit Application", QMessageBox.ButtonRole.DestructiveRole, "exit"),
+    ("Cancel", QMessageBox.ButtonRole.RejectRole, "cancel"),
+)
+
+# Skips per-entry icon lookups and symlink resolution, which can stall the file
+# dialogs for seconds on slow or network folders.
+FILE_DIALOG_OPTIONS = (QFileDialog.Option.DontUseCustomDirectoryIcons
+                       | QFileDialog.Option.DontResolveSymlinks)
+
 def browse_for_directory(parent, caption):
     """Opens a dialog to select a directory and returns the path."""
-    return QFileDialog.getExistingDirectory(parent, caption)
+    return QFileDialog.getExistingDirectory(
+        parent, caption, options=QFileDialog.Option.ShowDirsOnly | FILE_DIALOG_OPTIONS
+    )
 
 def show_info(parent, title, text):
     """Shows a standard information message box."""
@@ -38,18 +53,10 @@ def ask_minimize_or_exit(parent):
     msg_box.setText("What would you like to do?")
     msg_box.setIcon(QMessageBox.Icon.Question)
 
-    minimize_button = msg_box.addButton("Minimize to Tray", QMessageBox.ButtonRole.ActionRole)
-    exit_button = msg_box.addButton("Exit Application", QMessageBox.ButtonRole.DestructiveRole)
-    msg_box.addButton("Cancel", QMessageBox.ButtonRole.RejectRole)
-    
-    msg_box.setDefaultButton(minimize_button)
-    msg_box.exec()
+    # Map each button back to the action it represents
+    actions = {msg_box.addButton(text, role): action for text, role, action in _MINIMIZE_OR_EXIT_BUTTONS}
 
-    clicked = msg_box.clickedButton()
+    msg_box.setDefaultButton(next(iter(actions)))
+    msg_box.exec()
 
-    if clicked == minimize_button:
-        return "minimize"
-    elif clicked == exit_button:
-        return "exit"
-    else:
-        return "cancel"
\ No newline at end of file
+    return actions.get(msg_box.clickedButton(), "cancel")
\ No newline at end of file
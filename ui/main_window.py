@@ -1,15 +1,22 @@
 import base64
 import os
-from datetime import datetime
+import time
 
-from PyQt6.QtCore import pyqtSignal
+from PyQt6.QtCore import QTimer, pyqtSignal
 from PyQt6.QtGui import QIcon, QPixmap
 from PyQt6.QtWidgets import QMainWindow, QFileDialog
 
 from ui_main_window import Ui_Sims4RewindApp
 from resources import ICON_DATA_REWIND
 from utils import get_original_from_backup
+from .backup_list_model import BackupListModel
 from . import dialogs # Use relative import within the UI package
+from .dialogs import FILE_DIALOG_OPTIONS
+
+# The embedded icon is decoded once per process; the QIcon itself is built on
+# first use, since it needs a QApplication to exist.
+_ICON_BYTES = base64.b64decode(ICON_DATA_REWIND)
+_cached_icon = None
 
 class Sims4RewindApp(QMainWindow):
     """
@@ -33,6 +40,38 @@ class Sims4RewindApp(QMainWindow):
         self.ui.setupUi(self)
         self._set_window_icon()
 
+        # The backup list is a QListView backed by a lightweight model.
+        self.backup_list_model = BackupListModel(self)
+        self.ui.backup_list_widget.setModel(self.backup_list_model)
+
+        # Coalesces bursts of model updates (e.g. several backups pruned in a
+        # row) into a single refresh of the filter dropdown and backup list.
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(100)
+        self._refresh_timer.timeout.connect(self._refresh_backup_views)
+
+        # Log lines are timestamped as they arrive but written to the log tab in
+        # batches. The timestamp string is only re-formatted once per second.
+        self._pending_log_lines = []
+        self._log_timestamp_second = -1
+        self._log_timestamp = ""
+        self._log_flush_timer = QTimer(self)
+        self._log_flush_timer.setSingleShot(True)
+        self._log_flush_timer.setInterval(50)
+        self._log_flush_timer.timeout.connect(self._flush_log_messages)
+
+        # Settings are written once edits have settled, so a burst of changes
+        # costs a single write. Closing the window flushes a pending save.
+        self._settings_save_timer = QTimer(self)
+        self._settings_save_timer.setSingleShot(True)
+        self._settings_save_timer.setInterval(500)
+        self._settings_save_timer.timeout.connect(self._save_current_settings)
+
+        # The save names currently in the filter dropdown, so it is only
+        # rebuilt when they change. None until it is first populated.
+        self._last_filter_keys: tuple[str, ...] | None = None
+
         self._connect_ui_signals()
         # Service signals will be connected after dependencies are fully set
 
@@ -44,10 +83,13 @@ class Sims4RewindApp(QMainWindow):
 
     def _set_window_icon(self):
         """Sets the main window icon from embedded resource data."""
+        global _cached_icon
         try:
-            pixmap = QPixmap()
-            pixmap.loadFromData(base64.b64decode(ICON_DATA_REWIND))
-            self.setWindowIcon(QIcon(pixmap))
+            if _cached_icon is None:
+                pixmap = QPixmap()
+                pixmap.loadFromData(_ICON_BYTES)
+                _cached_icon = QIcon(pixmap)
+            self.setWindowIcon(_cached_icon)
         except Exception as e:
             self._update_status_label(f"Error loading icon: {e}")
 
@@ -59,9 +101,9 @@ class Sims4RewindApp(QMainWindow):
         self.ui.restore_to_button.clicked.connect(self._restore_backup_to_location)
         self.ui.toggle_monitoring_button.toggled.connect(self._toggle_monitoring)
         self.ui.startup_checkbox.toggled.connect(self.startup.set_startup)
-        self.ui.compress_backups_checkbox.toggled.connect(self._save_current_settings)
+        self.ui.compress_backups_checkbox.toggled.connect(self._schedule_settings_save)
         self.ui.backup_filter_dropdown.currentIndexChanged.connect(self._update_backup_list_display)
-        self.ui.backup_list_widget.itemSelectionChanged.connect(self._update_ui_element_states)
+        self.ui.backup_list_widget.selectionModel().currentChanged.connect(self._update_ui_element_states)
 
     def _connect_service_signals(self):
         """Connects signals from services and models to UI update slots."""
@@ -70,13 +112,15 @@ class Sims4RewindApp(QMainWindow):
         self.service.backup_created.connect(self.view_model.on_backup_created)
         self.service.backup_pruned.connect(self.view_model.on_backup_pruned)
         self.view_model.model_updated.connect(self._on_view_model_updated)
+        self.view_model.backup_added.connect(self._on_backup_added)
+        self.view_model.backup_removed.connect(self._on_backup_removed)
         self.log_message_requested.connect(self._append_log_message)
 
     def _load_initial_settings(self):
         """Loads settings and populates the UI fields."""
         settings = self.config.load_settings()
-        self.ui.saves_folder_path.setText(settings.get("saves_folder"))
-        self.ui.backup_folder_path.setText(settings.get("backup_folder"))
+        self.ui.set_path_text(self.ui.saves_folder_path, settings.get("saves_folder"))
+        self.ui.set_path_text(self.ui.backup_folder_path, settings.get("backup_folder"))
         self.ui.backup_count_spinbox.setValue(settings.get("backup_count"))
         self.ui.auto_monitor_checkbox.setChecked(settings.get("auto_monitor_on_startup"))
         self.ui.compress_backups_checkbox.setChecked(settings.get("compress_backups"))
@@ -95,11 +139,20 @@ class Sims4RewindApp(QMainWindow):
         self.config.save_settings(settings)
         self._update_status_label("Settings saved.")
 
+    def _schedule_settings_save(self):
+        """Saves the current settings once no further changes arrive for a short while."""
+        self._settings_save_timer.start()
+
     def _update_ui_element_states(self):
         """Enables or disables UI elements based on current state."""
-        has_selection = self.ui.backup_list_widget.currentItem() is not None
+        has_selection = self._selected_backup_filename() is not None
         self.ui.restore_button.setEnabled(has_selection)
 
+    def _selected_backup_filename(self):
+        """Returns the filename of the selected backup, or None if nothing is selected."""
+        index = self.ui.backup_list_widget.currentIndex()
+        return index.data() if index.isValid() else None
+
     # --- UI Update Slots (triggered by signals) ---
 
     def _on_monitoring_status_changed(self, is_monitoring):
@@ -109,40 +162,87 @@ class Sims4RewindApp(QMainWindow):
         self._update_status_label("Monitoring active." if is_monitoring else "Idle.")
 
     def _on_view_model_updated(self):
-        """Called when the view model's data changes. Refreshes the UI."""
-        self._populate_filter_dropdown()
-        self._update_backup_list_display()
+        """Called when the view model's data changes. Schedules a UI refresh."""
+        if not self._refresh_timer.isActive():
+            self._refresh_timer.start()
+
+    def _on_backup_added(self, backup_filename):
+        """Inserts a newly created backup into the list without rebuilding it."""
+        original_name = get_original_from_backup(backup_filename)
+        if self.ui.backup_filter_dropdown.findText(original_name) == -1:
+            # A save file seen for the first time also needs a filter entry.
+            self._on_view_model_updated()
+        elif self._backup_matches_filter(original_name):
+            self.backup_list_model.insert_backup(
+                backup_filename, self.view_model.get_backup_mtime(backup_filename))
+
+    def _on_backup_removed(self, backup_filename):
+        """Removes a pruned backup from the list without rebuilding it."""
+        self.backup_list_model.remove_backup(backup_filename)
+        if not self.view_model.has_backups_for(get_original_from_backup(backup_filename)):
+            # The last backup of a save file is gone, so drop its filter entry.
+            self._on_view_model_updated()
         self._update_ui_element_states()
 
+    def _backup_matches_filter(self, original_name):
+        """Returns True if backups of the given save file belong in the current list."""
+        filter_key = self.ui.backup_filter_dropdown.currentText()
+        return filter_key in ("Show All Backups", original_name)
+
+    def _refresh_backup_views(self):
+        """
+        Refreshes the filter dropdown and backup list from the view model, with
+        painting suspended so the whole refresh results in a single repaint.
+        """
+        central_widget = self.centralWidget()
+        central_widget.setUpdatesEnabled(False)
+        try:
+            self._populate_filter_dropdown()
+            # This also refreshes the restore button state.
+            self._update_backup_list_display()
+        finally:
+            central_widget.setUpdatesEnabled(True)
+        central_widget.update()
+
     def _update_status_label(self, message):
         """Updates the status bar with a new message."""
         self.ui.status_label.setText(f"Status: {message}")
         self.log_message_requested.emit(message) # Also send to log
 
     def _append_log_message(self, message):
-        """Appends a timestamped message to the log text edit."""
-        timestamp = datetime.now().strftime("[%Y-%m-%d %H:%M:%S]")
-        self.ui.log_text_edit.append(f"{timestamp} {message}")
+        """Queues a timestamped message for the log text edit."""
+        now = int(time.time())
+        if now != self._log_timestamp_second:
+            self._log_timestamp_second = now
+            self._log_timestamp = time.strftime("[%Y-%m-%d %H:%M:%S]", time.localtime(now))
+        self._pending_log_lines.append(f"{self._log_timestamp} {message}")
+        if not self._log_flush_timer.isActive():
+            self._log_flush_timer.start()
+
+    def _flush_log_messages(self):
+        """Appends all queued log messages to the log text edit in one go."""
+        self.ui.log_text_edit.appendPlainText("\n".join(self._pending_log_lines))
+        self._pending_log_lines.clear()
 
     def _populate_filter_dropdown(self):
-        """Populates the filter dropdown from the view model."""
-        dropdown = self.ui.backup_filter_dropdown
-        current_selection = dropdown.currentText()
-        dropdown.blockSignals(True)
-        dropdown.clear()
-        dropdown.addItem("Show All Backups")
-        dropdown.addItems(self.view_model.get_filter_options())
-        index = dropdown.findText(current_selection)
-        dropdown.setCurrentIndex(index if index != -1 else 0)
-        dropdown.blockSignals(False)
+        """Populates the filter dropdown from the view model, unless its options are unchanged."""
+        options = tuple(self.view_model.get_filter_options())
+        if options == self._last_filter_keys:
+            return
+        self._last_filter_keys = options
+
+        self.ui.set_filter_options("Show All Backups", options)
 
     def _update_backup_list_display(self):
         """Repopulates the backup list from the view model based on the current filter."""
-        self.ui.backup_list_widget.clear()
         filter_key = self.ui.backup_filter_dropdown.currentText()
-        backup_folder = self.ui.backup_folder_path.text()
-        backups = self.view_model.get_backups_for_display(filter_key, backup_folder)
-        self.ui.backup_list_widget.addItems(backups)
+        backups = self.view_model.get_backups_for_display(filter_key)
+
+        # Resetting the model clears the current selection without signalling,
+        # so the selection state is refreshed explicitly afterwards.
+        self.backup_list_model.set_rows(
+            backups, [self.view_model.get_backup_mtime(f) for f in backups])
+        self._update_ui_element_states()
 
     # --- User Action Handlers (triggered by UI signals) ---
 
@@ -150,20 +250,23 @@ class Sims4RewindApp(QMainWindow):
         """Delegates browsing for the saves folder."""
         folder = dialogs.browse_for_directory(self, "Select Sims 4 Saves Folder")
         if folder:
-            self.ui.saves_folder_path.setText(folder)
-            self._save_current_settings()
+            self.ui.set_path_text(self.ui.saves_folder_path, folder)
+            self._schedule_settings_save()
 
     def _browse_backup_folder(self):
         """Delegates browsing for the backup folder."""
         folder = dialogs.browse_for_directory(self, "Select Backup Location")
         if folder:
-            self.ui.backup_folder_path.setText(folder)
+            self.ui.set_path_text(self.ui.backup_folder_path, folder)
             self.view_model.rescan_backup_folder(folder)
-            self._save_current_settings()
+            self._schedule_settings_save()
 
     def _toggle_monitoring(self, checked):
         """Delegates starting or stopping monitoring to the backup service."""
         if checked:
+            # Saved right away rather than debounced, so "Settings saved." comes
+            # before the monitoring status instead of replacing it.
+            self._settings_save_timer.stop()
             self._save_current_settings()
             self.service.update_settings(
                 self.ui.saves_folder_path.text(),
@@ -177,11 +280,10 @@ class Sims4RewindApp(QMainWindow):
 
     def _restore_backup(self):
         """Handles the logic for restoring a selected backup."""
-        selected_item = self.ui.backup_list_widget.currentItem()
-        if not selected_item:
+        backup_filename = self._selected_backup_filename()
+        if not backup_filename:
             return
 
-        backup_filename = selected_item.text()
         original_savename = get_original_from_backup(backup_filename)
         if not original_savename:
             dialogs.show_critical(self, "Restore Error", f"Could not parse '{backup_filename}'.")
@@ -217,12 +319,11 @@ class Sims4RewindApp(QMainWindow):
 
     def _restore_backup_to_location(self):
         """Handles restoring a selected backup to a user-specified location."""
-        selected_item = self.ui.backup_list_widget.currentItem()
-        if not selected_item:
+        backup_filename = self._selected_backup_filename()
+        if not backup_filename:
             dialogs.show_warning(self, "Restore Error", "Please select a backup file from the list first.")
             return
 
-        backup_filename = selected_item.text()
         original_savename = get_original_from_backup(backup_filename)
         if not original_savename:
             dialogs.show_critical(self, "Restore Error", f"Could not parse original save name from '{backup_filename}'.")
@@ -233,7 +334,8 @@ class Sims4RewindApp(QMainWindow):
         
         # Open file dialog to get destination path and filename
         destination_path, _ = QFileDialog.getSaveFileName(
-            self, "Save Backup As", default_filename, "All Files (*)"
+            self, "Save Backup As", default_filename, "All Files (*)",
+            options=FILE_DIALOG_OPTIONS
         )
 
         if not destination_path:
@@ -299,10 +401,14 @@ class Sims4RewindApp(QMainWindow):
         """Handles the user trying to close the window."""
         action = dialogs.ask_minimize_or_exit(self)
         if action == "minimize":
+            if self._settings_save_timer.isActive():
+                self._settings_save_timer.stop()
+                self._save_current_settings()
             self.hide()
             event.ignore()
         elif action == "exit":
             self.service.stop_monitoring()
+            self._settings_save_timer.stop()
             self._save_current_settings()
             event.accept()
         else: # cancel
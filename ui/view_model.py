@@ -4,10 +4,115 @@ It holds the state and logic for filtering and displaying backups, completely
 separating the UI state from the UI widgets.
 """
 
+import bisect
 import os
+import sys
 from collections import defaultdict
-from PyQt6.QtCore import QObject, pyqtSignal
-from utils import get_original_from_backup
+from PyQt6.QtCore import QFileSystemWatcher, QObject, QRunnable, QThreadPool, QTimer, pyqtSignal
+from utils import clear_backup_filename_cache, get_original_from_backup
+
+# Number of backups whose modification times are read and delivered together
+# after a folder has been listed.
+MTIME_CHUNK_SIZE = 512
+
+def _interned_original_name(backup_filename):
+    """
+    Returns the save file name of a backup, interned so that every bucket key,
+    sorted key and filter option for the same save shares one string object.
+    """
+    original_name = get_original_from_backup(backup_filename)
+    return sys.intern(original_name) if original_name else None
+
+def scan_backup_folder(backup_folder):
+    """
+    Lists the backup folder without reading modification times. Returns a
+    mapping of each save file to its backups (all with an mtime of 0.0) and a
+    list of (original_name, DirEntry) pairs to pass to read_backup_mtimes, or
+    None if the folder does not exist.
+    """
+    if not backup_folder or not os.path.isdir(backup_folder):
+        return None
+
+    organized_backups = defaultdict(dict)
+    backup_entries = []
+    with os.scandir(backup_folder) as entries:
+        for entry in entries:
+            if not entry.name.endswith(('.bak', '.zip')) or not entry.is_file(follow_symlinks=False):
+                continue
+            original_name = _interned_original_name(entry.name)
+            if original_name:
+                organized_backups[original_name][entry.name] = 0.0
+                backup_entries.append((original_name, entry))
+    return organized_backups, backup_entries
+
+def read_backup_mtimes(backup_entries, chunk_size=MTIME_CHUNK_SIZE):
+    """
+    Reads the modification times of listed backups, yielding lists of
+    (original_name, filename, mtime) tuples of up to chunk_size backups.
+    Backups that disappeared since the listing are skipped.
+    """
+    chunk = []
+    for original_name, entry in backup_entries:
+        try:
+            # On Windows the stat result comes with the directory listing,
+            # elsewhere this is one stat call per backup.
+            chunk.append((original_name, entry.name, entry.stat().st_mtime))
+        except OSError:
+            continue
+        if len(chunk) == chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+class RescanSignals(QObject):
+    """Signals for RescanRunnable, which cannot define signals itself."""
+    # Carries the scan generation and the listed backups (None if the scan failed).
+    listed = pyqtSignal(int, object)
+    # Carries the scan generation and a chunk of modification times.
+    mtimes_available = pyqtSignal(int, object)
+    # Carries the scan generation once the scan has ended.
+    finished = pyqtSignal(int)
+
+class RescanRunnable(QRunnable):
+    """
+    Scans a backup folder on a thread pool thread, off the GUI thread. The
+    listing is delivered first so the backups can be shown right away, then
+    the modification times follow in chunks. If known_backups is given, only
+    the times of backups not in it are read.
+    """
+    def __init__(self, backup_folder, generation, known_backups=None):
+        super().__init__()
+        self.backup_folder = backup_folder
+        self.generation = generation
+        self.known_backups = known_backups
+        # Set from the GUI thread when a newer scan supersedes this one.
+        self.cancelled = False
+        self.signals = RescanSignals()
+
+    def run(self):
+        try:
+            scan = scan_backup_folder(self.backup_folder)
+        except Exception as e:
+            print(f"Error reading backup folder: {e}")
+            scan = None
+
+        if scan is not None:
+            organized_backups, backup_entries = scan
+            self.signals.listed.emit(self.generation, organized_backups)
+            if self.known_backups is not None:
+                backup_entries = [(original_name, entry) for original_name, entry in backup_entries
+                                  if entry.name not in self.known_backups]
+            try:
+                for chunk in read_backup_mtimes(backup_entries):
+                    if self.cancelled:
+                        break
+                    self.signals.mtimes_available.emit(self.generation, chunk)
+            except Exception as e:
+                print(f"Error reading backup modification times: {e}")
+        else:
+            self.signals.listed.emit(self.generation, None)
+        self.signals.finished.emit(self.generation)
 
 class BackupViewModel(QObject):
     """
@@ -16,87 +121,242 @@ class BackupViewModel(QObject):
     """
     # Signal emitted whenever the data changes, so the UI knows to refresh.
     model_updated = pyqtSignal()
+    # Signals carrying a single backup filename, so the UI can update one row
+    # instead of rebuilding the whole list.
+    backup_added = pyqtSignal(str)
+    backup_removed = pyqtSignal(str)
 
     def __init__(self, parent=None):
         super().__init__(parent)
-        # The in-memory "source of truth" for the state of backups.
-        self._organized_backups = defaultdict(list)
+        # The in-memory "source of truth" for the state of backups: each save
+        # file maps its backup filenames to their modification times, so
+        # sorting never touches the disk and removals are constant-time.
+        self._organized_backups: defaultdict[str, dict[str, float]] = defaultdict(dict)
+        # The save file names in sorted order, kept up to date incrementally
+        # so the filter options never need re-sorting.
+        self._sorted_keys: list[str] = []
+        self._backup_folder = None
+        # Whether the last scan found the backup folder, so displaying backups
+        # never has to check the filesystem.
+        self._last_scan_ok = False
+        # State of the background rescan: the latest generation started, the
+        # runnable still in flight, whether the folder is still being listed,
+        # and backups created or pruned before the listing arrived.
+        self._scan_generation = 0
+        self._rescan = None
+        self._scan_listing = False
+        self._pending_changes = []
+        # Watches the backup folder for changes made outside the app. Bursts of
+        # change notifications are debounced into one listing of the folder,
+        # which runs on the thread pool and is diffed against the model.
+        self._fs_watcher = QFileSystemWatcher(self)
+        self._fs_watcher.directoryChanged.connect(self._on_backup_folder_changed)
+        self._sync_timer = QTimer(self)
+        self._sync_timer.setSingleShot(True)
+        self._sync_timer.setInterval(300)
+        self._sync_timer.timeout.connect(self._sync_with_backup_folder)
+        self._sync = None
 
     def rescan_backup_folder(self, backup_folder):
         """
-        Performs a full scan of the backup folder to rebuild the model.
+        Starts a full scan of the backup folder to rebuild the model. The scan
+        runs on the global thread pool; model_updated is emitted once the folder
+        has been listed and again as modification times arrive.
         This should be called on startup or when the backup path changes.
         """
         self._organized_backups.clear()
-        if not os.path.isdir(backup_folder):
-            self.model_updated.emit()
+        self._sorted_keys.clear()
+        # Parses cached for the previous folder are unlikely to be needed again.
+        clear_backup_filename_cache()
+        self._backup_folder = backup_folder
+        self._last_scan_ok = False
+        if self._fs_watcher.directories():
+            self._fs_watcher.removePaths(self._fs_watcher.directories())
+        if backup_folder:
+            self._fs_watcher.addPath(backup_folder)
+        # A newer scan supersedes any still in flight; their results are dropped.
+        if self._rescan is not None:
+            self._rescan.cancelled = True
+        self._scan_generation += 1
+        self._scan_listing = True
+        self._pending_changes.clear()
+        self._rescan = RescanRunnable(backup_folder, self._scan_generation)
+        self._rescan.signals.listed.connect(self._on_rescan_listed)
+        self._rescan.signals.mtimes_available.connect(self._on_rescan_mtimes_available)
+        self._rescan.signals.finished.connect(self._on_rescan_finished)
+        QThreadPool.globalInstance().start(self._rescan)
+
+    def is_rescanning(self):
+        """Returns True while a rescan of the backup folder is in progress."""
+        return self._rescan is not None
+
+    def _on_rescan_listed(self, generation, organized_backups):
+        """Swaps in the listing of the latest scan, replaying changes made while it ran."""
+        if generation != self._scan_generation:
             return
+        self._scan_listing = False
+        self._last_scan_ok = organized_backups is not None
+        if organized_backups is None:
+            organized_backups = defaultdict(dict)
+        for original_name, backup_filename, mtime in self._pending_changes:
+            if mtime is None:
+                organized_backups[original_name].pop(backup_filename, None)
+                if not organized_backups[original_name]:
+                    del organized_backups[original_name]
+            else:
+                organized_backups[original_name][backup_filename] = mtime
+        self._pending_changes.clear()
+        self._organized_backups = organized_backups
+        self._sorted_keys = sorted(organized_backups)
+        self.model_updated.emit()
 
-        try:
-            files = [f for f in os.listdir(backup_folder) if f.endswith(('.bak', '.zip'))]
-            for filename in files:
-                original_name = get_original_from_backup(filename)
-                if original_name:
-                    self._organized_backups[original_name].append(filename)
-        except Exception as e:
-            print(f"Error reading backup folder: {e}")
-        
+    def _on_rescan_mtimes_available(self, generation, chunk):
+        """Fills in modification times from the latest scan; the UI re-sorts on its next refresh."""
+        if generation != self._scan_generation:
+            return
+        for original_name, backup_filename, mtime in chunk:
+            bucket = self._organized_backups.get(original_name)
+            # Backups pruned since the listing are not brought back.
+            if bucket is not None and backup_filename in bucket:
+                bucket[backup_filename] = mtime
         self.model_updated.emit()
 
+    def _on_rescan_finished(self, generation):
+        """Forgets the latest scan once it has ended."""
+        if generation == self._scan_generation:
+            self._rescan = None
+
+    def _on_backup_folder_changed(self, path):
+        """Schedules a sync with the backup folder after a change on disk."""
+        if not self._sync_timer.isActive():
+            self._sync_timer.start()
+
+    def _sync_with_backup_folder(self):
+        """Lists the backup folder in the background to pick up external changes."""
+        if self._sync is not None:
+            # A listing is still running; look again once it has had time to finish.
+            self._sync_timer.start()
+            return
+        # Only backups missing from this snapshot have their times read, on the
+        # worker thread rather than here.
+        known = frozenset(backup_filename for bucket in self._organized_backups.values()
+                          for backup_filename in bucket)
+        self._sync = RescanRunnable(self._backup_folder, self._scan_generation, known_backups=known)
+        self._sync.signals.listed.connect(self._on_sync_listed)
+        self._sync.signals.mtimes_available.connect(self._on_sync_mtimes_available)
+        self._sync.signals.finished.connect(self._on_sync_finished)
+        QThreadPool.globalInstance().start(self._sync)
+
+    def _on_sync_listed(self, generation, organized_backups):
+        """Removes backups missing from a fresh listing as single-backup changes."""
+        if generation != self._scan_generation or self._scan_listing:
+            # A rescan has started since; its own listing covers the change.
+            return
+        listed = set()
+        for bucket in (organized_backups or {}).values():
+            listed.update(bucket)
+        known = set()
+        for bucket in self._organized_backups.values():
+            known.update(bucket)
+
+        for backup_filename in known - listed:
+            self.on_backup_pruned(backup_filename)
+
+    def _on_sync_mtimes_available(self, generation, chunk):
+        """Adds the backups a fresh listing found, with the times read in the background."""
+        if generation != self._scan_generation or self._scan_listing:
+            return
+        for original_name, backup_filename, mtime in chunk:
+            # The app may have added it itself since the listing started.
+            if backup_filename not in self._organized_backups.get(original_name, ()):
+                self._add_backup(original_name, backup_filename, mtime)
+
+    def _on_sync_finished(self, generation):
+        """Allows the next sync with the backup folder to start."""
+        self._sync = None
+
     def on_backup_created(self, new_backup_filename):
         """
         Updates the model with a newly created backup file, avoiding a full rescan.
         """
-        original_name = get_original_from_backup(new_backup_filename)
-        if not original_name:
+        original_name = _interned_original_name(new_backup_filename)
+        if not original_name or new_backup_filename in self._organized_backups.get(original_name, ()):
             return
 
-        self._organized_backups[original_name].append(new_backup_filename)
-        self.model_updated.emit()
+        try:
+            mtime = os.path.getmtime(os.path.join(self._backup_folder, new_backup_filename))
+        except (OSError, TypeError):
+            # The folder was never scanned or the file is already gone; sort it last.
+            mtime = 0.0
+        if self._scan_listing:
+            # The listing in flight may have missed this file; apply it afterwards.
+            self._pending_changes.append((original_name, new_backup_filename, mtime))
+            return
+        self._add_backup(original_name, new_backup_filename, mtime)
+
+    def _add_backup(self, original_name, backup_filename, mtime):
+        """Adds a single backup to the model and signals it."""
+        if original_name not in self._organized_backups:
+            bisect.insort(self._sorted_keys, original_name)
+        self._organized_backups[original_name][backup_filename] = mtime
+        self.backup_added.emit(backup_filename)
 
     def on_backup_pruned(self, pruned_backup_filename):
         """
         Updates the model by removing a pruned backup file.
         """
         original_name = get_original_from_backup(pruned_backup_filename)
-        if not original_name or original_name not in self._organized_backups:
+        if not original_name:
+            return
+        if self._scan_listing:
+            # The listing in flight may still include this file; drop it afterwards.
+            self._pending_changes.append((original_name, pruned_backup_filename, None))
+            return
+        if original_name not in self._organized_backups:
             return
 
-        if pruned_backup_filename in self._organized_backups[original_name]:
-            self._organized_backups[original_name].remove(pruned_backup_filename)
-            # If no backups are left for this save, remove the key
-            if not self._organized_backups[original_name]:
-                del self._organized_backups[original_name]
-        
-        self.model_updated.emit()
+        if self._organized_backups[original_name].pop(pruned_backup_filename, None) is None:
+            return
+
+        # If no backups are left for this save, remove the key
+        if not self._organized_backups[original_name]:
+            del self._organized_backups[original_name]
+            del self._sorted_keys[bisect.bisect_left(self._sorted_keys, original_name)]
+
+        self.backup_removed.emit(pruned_backup_filename)
+
+    def get_backup_mtime(self, backup_filename):
+        """Returns the cached modification time of a backup, or 0.0 if it is unknown."""
+        bucket = self._organized_backups.get(get_original_from_backup(backup_filename), {})
+        return bucket.get(backup_filename, 0.0)
+
+    def has_backups_for(self, original_name):
+        """Returns True if at least one backup of the given save file is known."""
+        return original_name in self._organized_backups
 
     def get_filter_options(self):
-        """Returns a sorted list of unique save file names for the filter dropdown."""
-        return sorted(self._organized_backups.keys())
+        """
+        Returns a sorted list of unique save file names for the filter dropdown.
+        The list is owned by the view model and must not be modified.
+        """
+        return self._sorted_keys
 
-    def get_backups_for_display(self, filter_key, backup_folder):
+    def get_backups_for_display(self, filter_key):
         """
         Returns a list of backup filenames, sorted by time, based on the filter.
         """
-        files_to_display = []
+        mtimes = {}
         if filter_key == "Show All Backups":
-            for key in self._organized_backups:
-                files_to_display.extend(self._organized_backups[key])
+            for bucket in self._organized_backups.values():
+                mtimes.update(bucket)
         elif filter_key in self._organized_backups:
-            files_to_display = self._organized_backups[filter_key]
+            mtimes = self._organized_backups[filter_key]
         
-        if not files_to_display or not os.path.isdir(backup_folder):
+        if not mtimes or not self._last_scan_ok:
             return []
 
-        # Sort the final list by modification time (most recent first)
-        try:
-            files_to_display.sort(
-                key=lambda f: os.path.getmtime(os.path.join(backup_folder, f)),
-                reverse=True
-            )
-            return files_to_display
-        except FileNotFoundError:
-            # This can happen if a file is deleted externally. The model will be
-            # corrected on the next full rescan.
-            print("A backup file was not found during sorting.")
-            return []
+        # Sort the final list by modification time (most recent first), breaking
+        # ties by name so the order matches the list model's incremental inserts.
+        # Sorting (mtime, name) pairs directly avoids a key function call per file.
+        decorated = sorted(((mtime, f) for f, mtime in mtimes.items()), reverse=True)
+        return [f for _, f in decorated]
@@ -4,12 +4,79 @@
 # This file is responsible ONLY for defining the user interface layout
 # and widgets. It contains no application logic.
 
+from contextlib import contextmanager
+
+from PyQt6.QtCore import Qt
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel,
-    QLineEdit, QListWidget, QSpinBox, QCheckBox, QGroupBox, QComboBox, QTabWidget, QTextEdit
+    QLineEdit, QListView, QSpinBox, QCheckBox, QGroupBox, QComboBox, QTabWidget, QPlainTextEdit
 )
 
+# Styles for the whole window, applied once to the main window so Qt parses
+# them in a single pass. Widgets are targeted by their object names.
+MAIN_WINDOW_STYLESHEET = """
+    QLabel#statusLabel { font-style: italic; color: #555; }
+    QPushButton#toggleMonitoringButton { background-color: #4CAF50; color: white; border-radius: 5px; padding: 5px;}
+    QPushButton#toggleMonitoringButton:checked { background-color: #f44336; }
+    QPushButton#restoreToButton { background-color: #FFC107; color: black; border-radius: 5px; padding: 5px; }
+    QPushButton#restoreButton { background-color: #008CBA; color: white; border-radius: 5px; padding: 5px; }
+"""
+
 class Ui_Sims4RewindApp(object):
+    @contextmanager
+    def bulk_update(self, widget):
+        """
+        Suspends painting and signals of a widget while it is repopulated, so
+        the changes cost a single repaint and no per-item signals. Wrap loops
+        that refill the filter dropdown or the backup list with this.
+        """
+        widget.setUpdatesEnabled(False)
+        widget.blockSignals(True)
+        try:
+            yield widget
+        finally:
+            widget.blockSignals(False)
+            widget.setUpdatesEnabled(True)
+
+    def _row(self, *widgets, stretch_at=None):
+        """
+        Builds a horizontal row of widgets, with a stretch inserted before the
+        widget at index stretch_at (or after the last one if it equals their count).
+        """
+        row = QHBoxLayout()
+        row.setContentsMargins(0, 0, 0, 0)
+        for index, widget in enumerate(widgets):
+            if index == stretch_at:
+                row.addStretch()
+            row.addWidget(widget)
+        if stretch_at == len(widgets):
+            row.addStretch()
+        return row
+
+    def set_path_text(self, line_edit, path):
+        """
+        Shows a folder path in one of the path fields, scrolled to its start so
+        the beginning of a long path stays visible without scrolling.
+        """
+        line_edit.setText(path)
+        line_edit.setCursorPosition(0)
+
+    def set_filter_options(self, all_option, names):
+        """
+        Replaces the filter dropdown options with all_option followed by names,
+        in a single update. The names are added as given, so they must already
+        be unique, sorted and interned (as BackupViewModel.get_filter_options
+        returns them). The current selection is kept if it is still available,
+        otherwise all_option is selected.
+        """
+        dropdown = self.backup_filter_dropdown
+        current_selection = dropdown.currentText()
+        with self.bulk_update(dropdown):
+            dropdown.clear()
+            dropdown.addItems((all_option, *names))
+            index = dropdown.findText(current_selection)
+            dropdown.setCurrentIndex(index if index != -1 else 0)
+
     def setupUi(self, MainWindow):
         """
         Sets up the entire user interface for the main window.
@@ -19,9 +86,13 @@ class Ui_Sims4RewindApp(object):
         MainWindow.setWindowTitle("Sims4Rewind")
         MainWindow.setGeometry(100, 100, 700, 550)
         MainWindow.setMinimumSize(600, 500)
+        MainWindow.setStyleSheet(MAIN_WINDOW_STYLESHEET)
 
         self.central_widget = QWidget(MainWindow)
         MainWindow.setCentralWidget(self.central_widget)
+        # The central widget paints nothing itself (its children repaint on
+        # their own), so on resize only newly exposed areas need painting.
+        self.central_widget.setAttribute(Qt.WidgetAttribute.WA_StaticContents, True)
         
         self.main_layout = QVBoxLayout(self.central_widget)
         self.main_layout.setSpacing(15)
@@ -37,47 +108,34 @@ class Ui_Sims4RewindApp(object):
         self.backup_count_spinbox = QSpinBox()
         self.startup_checkbox = QCheckBox("Start with Windows")
         self.auto_monitor_checkbox = QCheckBox("Auto-monitor on startup")
+        # The paths are usually browsed to rather than typed, so skip the
+        # macOS focus ring repaint when the fields gain focus.
+        for path_field in (self.saves_folder_path, self.backup_folder_path):
+            path_field.setAttribute(Qt.WidgetAttribute.WA_MacShowFocusRect, False)
 
-        saves_layout = QHBoxLayout()
-        saves_layout.addWidget(QLabel("Sims 4 Saves Folder:"))
-        saves_layout.addWidget(self.saves_folder_path)
-        saves_layout.addWidget(self.browse_saves_button)
-        settings_layout.addLayout(saves_layout)
-
-        backup_layout = QHBoxLayout()
-        backup_layout.addWidget(QLabel("Backup Location:"))
-        backup_layout.addWidget(self.backup_folder_path)
-        backup_layout.addWidget(self.browse_backups_button)
-        settings_layout.addLayout(backup_layout)
-        
-        other_settings_layout = QHBoxLayout()
-        other_settings_layout.addWidget(QLabel("Backups to keep per file:"))
-        self.backup_count_spinbox.setRange(1, 100)
-        other_settings_layout.addWidget(self.backup_count_spinbox)
-        other_settings_layout.addStretch()
-        other_settings_layout.addWidget(self.auto_monitor_checkbox)
         self.compress_backups_checkbox = QCheckBox("Compress backups (.zip)")
-        other_settings_layout.addWidget(self.compress_backups_checkbox)
-        other_settings_layout.addWidget(self.startup_checkbox)
-        settings_layout.addLayout(other_settings_layout)
+        self.backup_count_spinbox.setRange(1, 100)
+
+        settings_layout.addLayout(self._row(
+            QLabel("Sims 4 Saves Folder:"), self.saves_folder_path, self.browse_saves_button))
+        settings_layout.addLayout(self._row(
+            QLabel("Backup Location:"), self.backup_folder_path, self.browse_backups_button))
+        settings_layout.addLayout(self._row(
+            QLabel("Backups to keep per file:"), self.backup_count_spinbox,
+            self.auto_monitor_checkbox, self.compress_backups_checkbox, self.startup_checkbox,
+            stretch_at=2))
 
         self.settings_group.setLayout(settings_layout)
         self.main_layout.addWidget(self.settings_group)
 
         # --- Status and Monitoring ---
-        status_layout = QHBoxLayout()
         self.status_label = QLabel("Status: Idle. Configure settings and start monitoring.")
-        self.status_label.setStyleSheet("font-style: italic; color: #555;")
+        self.status_label.setObjectName("statusLabel")
         self.toggle_monitoring_button = QPushButton("Start Monitoring")
         self.toggle_monitoring_button.setCheckable(True)
-        self.toggle_monitoring_button.setStyleSheet("""
-            QPushButton { background-color: #4CAF50; color: white; border-radius: 5px; padding: 5px;}
-            QPushButton:checked { background-color: #f44336; }
-        """)
-        status_layout.addWidget(self.status_label)
-        status_layout.addStretch()
-        status_layout.addWidget(self.toggle_monitoring_button)
-        self.main_layout.addLayout(status_layout)
+        self.toggle_monitoring_button.setObjectName("toggleMonitoringButton")
+        self.main_layout.addLayout(self._row(
+            self.status_label, self.toggle_monitoring_button, stretch_at=1))
 
         # --- Tab Widget for Backups and Log ---
         self.main_tabs = QTabWidget()
@@ -90,29 +148,26 @@ class Ui_Sims4RewindApp(object):
         backups_layout = QVBoxLayout()
 
         # --- CHANGE START: Add the filter dropdown ---
-        filter_layout = QHBoxLayout()
-        filter_layout.addWidget(QLabel("Filter by Save File:"))
         self.backup_filter_dropdown = QComboBox()
-        filter_layout.addWidget(self.backup_filter_dropdown)
-        filter_layout.addStretch()
-        backups_layout.addLayout(filter_layout)
+        backups_layout.addLayout(self._row(
+            QLabel("Filter by Save File:"), self.backup_filter_dropdown, stretch_at=2))
         # --- CHANGE END ---
 
-        self.backup_list_widget = QListWidget()
+        self.backup_list_widget = QListView()
+        self.backup_list_widget.setEditTriggers(QListView.EditTrigger.NoEditTriggers)
+        # Every row is a single line of text, so Qt can skip per-row size hints.
+        self.backup_list_widget.setUniformItemSizes(True)
         
-        # Restore Buttons Layout
-        restore_buttons_layout = QHBoxLayout()
+        # Restore Buttons
         self.restore_to_button = QPushButton("Restore to...")
-        self.restore_to_button.setStyleSheet("background-color: #FFC107; color: black; border-radius: 5px; padding: 5px;") # Yellowish color
-        restore_buttons_layout.addWidget(self.restore_to_button)
+        self.restore_to_button.setObjectName("restoreToButton") # Yellowish color
 
         self.restore_button = QPushButton("Restore Selected Backup")
-        self.restore_button.setStyleSheet("background-color: #008CBA; color: white; border-radius: 5px; padding: 5px;")
+        self.restore_button.setObjectName("restoreButton")
         self.restore_button.setEnabled(False) # Initially disabled
-        restore_buttons_layout.addWidget(self.restore_button)
 
         backups_layout.addWidget(self.backup_list_widget)
-        backups_layout.addLayout(restore_buttons_layout)
+        backups_layout.addLayout(self._row(self.restore_to_button, self.restore_button))
         self.backups_group.setLayout(backups_layout)
         self.backups_tab_layout.addWidget(self.backups_group)
         self.main_tabs.addTab(self.backups_tab, "Backups")
@@ -120,8 +175,10 @@ class Ui_Sims4RewindApp(object):
         # --- Log Tab ---
         self.log_tab = QWidget()
         self.log_tab_layout = QVBoxLayout(self.log_tab)
-        self.log_text_edit = QTextEdit()
+        self.log_text_edit = QPlainTextEdit()
         self.log_text_edit.setReadOnly(True)
+        # Keep only the most recent lines so appends stay cheap during long sessions.
+        self.log_text_edit.setMaximumBlockCount(2000)
         self.log_tab_layout.addWidget(self.log_text_edit)
         self.main_tabs.addTab(self.log_tab, "Log")
 
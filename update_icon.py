@@ -6,9 +6,9 @@
 # multi-size .ico file, saves it, base64 encodes it, and updates resources.py.
 
 import os
-import base64
+import binascii
 import io
-import re
+import mmap
 import sys
 
 # --- Configuration ---
@@ -18,22 +18,116 @@ SOURCE_IMAGE_FOLDER = os.path.join(SCRIPT_DIR, "icon_source")
 RESOURCES_FILE = os.path.join(SCRIPT_DIR, "resources.py")
 ICON_VARIABLE_NAME = "ICON_DATA_REWIND"
 OUTPUT_ICON_FILE = os.path.join(SCRIPT_DIR, "app.ico") # <-- ADDED: Path for the output .ico
+SOURCE_IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.bmp')
+# The sizes embedded in the .ico file
+ICON_SIZES = ((256, 256), (128, 128), (64, 64), (48, 48), (32, 32), (24, 24), (16, 16))
+# Large source images are scaled down to fit this before the icon sizes are
+# made (see working_size), which leaves enough detail for the largest size
+SOURCE_WORKING_SIZE = (512, 512)
+# Records the source image (path, mtime and size) and encoder settings app.ico
+# was built from
+ICON_CACHE_FILE = OUTPUT_ICON_FILE + ".cache"
+# Part of the cache key; bump it when the way app.ico is built changes
+ICON_CACHE_VERSION = 2
+
+def find_icon_data(content):
+    """
+    Locates the triple-quoted bytes literal assigned to ICON_VARIABLE_NAME
+    with plain byte searches, trying both quote styles.
+
+    Args:
+        content: The raw bytes of the resources file (e.g. a memory map).
 
-def update_icon_resource(Image):
+    Returns:
+        The (start, end) indices of the text between the quotes, or None.
     """
-    Finds an image, converts it to a base64-encoded .ico in memory,
-    and updates the resources file.
+    for quote in (b'"""', b"'''"):
+        opening = ICON_VARIABLE_NAME.encode('ascii') + b" = b" + quote
+        start = content.find(opening)
+        if start == -1:
+            continue
+        start += len(opening)
+        end = content.find(quote, start)
+        if end != -1:
+            return start, end
+    return None
+
+def read_cached_icon(cache_key):
+    """
+    Reads the previously generated .ico file if it was built from the same
+    source image with the same settings.
+
+    Args:
+        cache_key: The key built by icon_cache_key for the current source image.
+
+    Returns:
+        The .ico file contents, or None if the icon must be regenerated.
+    """
+    try:
+        with open(ICON_CACHE_FILE, 'r', encoding='utf-8') as f:
+            if f.read().strip() != cache_key:
+                return None
+        with open(OUTPUT_ICON_FILE, 'rb') as f:
+            return f.read()
+    except OSError:
+        return None
+
+def icon_cache_key(source_image_path, source_stat):
+    """
+    Builds the key recorded next to app.ico. It changes whenever the source
+    image is replaced or edited, or the icon sizes or working size change.
+    """
+    return (f"{ICON_CACHE_VERSION}|{source_image_path}|{source_stat.st_mtime_ns}:{source_stat.st_size}"
+            f"|{ICON_SIZES}|{SOURCE_WORKING_SIZE}")
+
+def working_size(image_size):
+    """
+    Works out the size a source image is scaled down to before the icon sizes
+    are made. The image is fitted into SOURCE_WORKING_SIZE, but never so far
+    that its shorter side drops below the largest icon size, since Pillow
+    leaves out every icon size larger than the image (e.g. a 1000x300 source
+    becomes 853x256, not 512x154). Images are never enlarged.
 
     Args:
-        Image: The Pillow Image module.
+        image_size: The (width, height) of the source image.
+
+    Returns:
+        The (width, height) to scale the image to.
+    """
+    width, height = image_size
+    largest_icon_side = max(max(size) for size in ICON_SIZES)
+    scale = min(SOURCE_WORKING_SIZE[0] / width, SOURCE_WORKING_SIZE[1] / height)
+    scale = min(1, max(scale, largest_icon_side / min(width, height)))
+    return max(1, round(width * scale)), max(1, round(height * scale))
+
+def load_pillow_image_module():
+    """
+    Imports Pillow's Image module, exiting with an explanation if Pillow is
+    not installed. Only needed when the icon has to be regenerated.
+    """
+    try:
+        from PIL import Image
+    except ImportError:
+        print("Error: The 'Pillow' library is required to run this script.", file=sys.stderr)
+        print("Please install it using your preferred package manager, e.g., 'pip install Pillow'", file=sys.stderr)
+        sys.exit(1)
+    return Image
+
+def update_icon_resource():
+    """
+    Finds an image, converts it to a base64-encoded .ico in memory,
+    and updates the resources file. Pillow is only imported when the
+    icon actually has to be regenerated.
     """
     # 1. Find the source image
     source_image_path = None
     try:
-        for file in os.listdir(SOURCE_IMAGE_FOLDER):
-            if file.lower().endswith(('.png', '.jpg', '.jpeg', '.bmp')):
-                source_image_path = os.path.join(SOURCE_IMAGE_FOLDER, file)
-                break
+        # scandir stops reading the folder at the first match
+        with os.scandir(SOURCE_IMAGE_FOLDER) as entries:
+            for entry in entries:
+                if entry.name.lower().endswith(SOURCE_IMAGE_EXTENSIONS) and entry.is_file():
+                    source_image_path = entry.path
+                    break
     except FileNotFoundError:
         print(f"Error: The source directory '{SOURCE_IMAGE_FOLDER}' was not found.")
         sys.exit(1)
@@ -44,53 +138,72 @@ def update_icon_resource(Image):
 
     print(f"Processing image: {source_image_path}")
 
-    # 2. Convert image to a multi-size .ico file
-    try:
-        img = Image.open(source_image_path)
-        icon_sizes = [(16, 16), (24, 24), (32, 32), (48, 48), (64, 64), (128, 128), (256, 256)]
-        
-        # --- CHANGE: Save the icon to a physical file for PyInstaller ---
-        img.save(OUTPUT_ICON_FILE, format='ICO', sizes=icon_sizes)
-        print(f"Successfully created icon file: {OUTPUT_ICON_FILE}")
-
-        # Use an in-memory binary stream for the base64 encoding
-        with io.BytesIO() as ico_stream:
-            img.save(ico_stream, format='ICO', sizes=icon_sizes)
-            ico_data = ico_stream.getvalue()
+    # 2. Convert image to a multi-size .ico file, unless app.ico was already
+    #    built from this exact source image with the current settings
+    cache_key = icon_cache_key(source_image_path, os.stat(source_image_path))
+    ico_data = read_cached_icon(cache_key)
 
-    except Exception as e:
-        print(f"Error converting image to .ico: {e}")
-        sys.exit(1)
+    if ico_data is not None:
+        print(f"Source image unchanged, reusing icon file: {OUTPUT_ICON_FILE}")
+    else:
+        Image = load_pillow_image_module()
+        try:
+            img = Image.open(source_image_path)
+            target_size = working_size(img.size)
+            if target_size != img.size:
+                if img.format == 'JPEG':
+                    # Let the JPEG decoder produce a reduced-scale image directly
+                    img.draft('RGB', target_size)
+                img = img.resize(target_size, Image.Resampling.LANCZOS)
+
+            # Encode the .ico once in memory; the same bytes are embedded below
+            with io.BytesIO() as ico_stream:
+                img.save(ico_stream, format='ICO', sizes=ICON_SIZES)
+                ico_data = ico_stream.getvalue()
+
+            # --- CHANGE: Save the icon to a physical file for PyInstaller ---
+            with open(OUTPUT_ICON_FILE, 'wb') as f:
+                f.write(ico_data)
+            with open(ICON_CACHE_FILE, 'w', encoding='utf-8') as f:
+                f.write(cache_key)
+            print(f"Successfully created icon file: {OUTPUT_ICON_FILE}")
+
+        except Exception as e:
+            print(f"Error converting image to .ico: {e}")
+            sys.exit(1)
 
-    # 3. Base64 encode the .ico data
-    encoded_data = base64.b64encode(ico_data)
+    # 3. Base64 encode the .ico data into 76-character lines. Each 57-byte
+    #    slice of the memoryview encodes to one line without copying the input.
+    ico_view = memoryview(ico_data)
+    formatted_data = '\n'.join(
+        binascii.b2a_base64(ico_view[i:i + 57], newline=False).decode('ascii')
+        for i in range(0, len(ico_view), 57)
+    )
 
     # 4. Update the resources.py file
     try:
-        with open(RESOURCES_FILE, 'r', encoding='utf-8') as f:
-            content = f.read()
-
-        pattern = re.compile(
-            f"({ICON_VARIABLE_NAME}\\s*=\\s*b(""" + r'"""' + r"|'''))" +
-            ".*?" +
-            r"(\2)",
-            re.DOTALL
-        )
-
-        formatted_data = '\n'.join(encoded_data.decode('ascii')[i:i+78] for i in range(0, len(encoded_data), 78))
-
-        def replacer(match):
-            return f"{match.group(1)}\n{formatted_data}\n{match.group(3)}"
-
-        new_content, num_replacements = pattern.subn(replacer, content)
-
-        if num_replacements == 0:
-            print(f"Error: Could not find the variable '{ICON_VARIABLE_NAME}' in {RESOURCES_FILE}.")
-            print("Please ensure the file contains a block like: ICON_DATA_REWIND = b'''...''' or b\"\"\"...\"\"\"")
-            sys.exit(1)
-
-        with open(RESOURCES_FILE, 'w', encoding='utf-8') as f:
-            f.write(new_content)
+        # Map the file instead of reading it into memory, and write the new file
+        # in three pieces around the icon data. It is written next to the
+        # original and swapped in, since the original is mapped while writing.
+        temp_resources_file = RESOURCES_FILE + ".tmp"
+        with open(RESOURCES_FILE, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+            icon_data_span = find_icon_data(content)
+
+            if icon_data_span is None:
+                print(f"Error: Could not find the variable '{ICON_VARIABLE_NAME}' in {RESOURCES_FILE}.")
+                print("Please ensure the file contains a block like: ICON_DATA_REWIND = b'''...''' or b\"\"\"...\"\"\"")
+                sys.exit(1)
+
+            data_start, data_end = icon_data_span
+            # Keep the file's existing line endings
+            newline = b'\r\n' if content[data_start:data_start + 2] == b'\r\n' else b'\n'
+            payload = formatted_data.encode('ascii').replace(b'\n', newline)
+
+            with open(temp_resources_file, 'wb') as out:
+                out.write(content[:data_start])
+                out.write(newline + payload + newline)
+                out.write(content[data_end:])
+        os.replace(temp_resources_file, RESOURCES_FILE)
 
         print(f"Successfully updated '{ICON_VARIABLE_NAME}' in {RESOURCES_FILE}.")
 
@@ -102,11 +215,4 @@ def update_icon_resource(Image):
         sys.exit(1)
 
 if __name__ == "__main__":
-    try:
-        from PIL import Image
-    except ImportError:
-        print("Error: The 'Pillow' library is required to run this script.", file=sys.stderr)
-        print("Please install it using your preferred package manager, e.g., 'pip install Pillow'", file=sys.stderr)
-        sys.exit(1)
-    else:
-        update_icon_resource(Image)
\ No newline at end of file
+    update_icon_resource()
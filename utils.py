@@ -5,11 +5,56 @@
 # to promote code reuse and adhere to the DRY principle.
 
 import re
+from functools import lru_cache
+
+# Matches a backup filename, capturing the original save filename:
+#   (.*?\.save)  - Group 1: Captures the original filename (e.g., "Slot_00000002.save").
+#                - The lazy `.*?` stops at the first ".save" followed by the timestamp.
+#   _            - A literal underscore separating the name from the timestamp.
+#   \d{4}...     - The timestamp format (YYYY-MM-DD_HH-MM-SS); it is not captured.
+#   \.(?:bak|zip)$ - The literal string ".bak" or ".zip" at the end of the filename.
+#   re.IGNORECASE makes the match work for both "Slot" and "slot", etc.
+# The pattern is compiled once at import time rather than on every call.
+_BACKUP_RE = re.compile(r'(.*?\.save)_\d{4}-\d{2}-\d{2}_\d{2}-\d{2}-\d{2}\.(?:bak|zip)$', re.IGNORECASE)
+
+def _is_backup_suffix(suffix: str) -> bool:
+    """
+    Checks that the part of a backup filename after ".save_" is exactly a
+    timestamp (YYYY-MM-DD_HH-MM-SS) followed by ".bak" or ".zip".
+    """
+    return (len(suffix) == 23
+            and suffix[19:].lower() in ('.bak', '.zip')
+            and suffix[4] == suffix[7] == suffix[13] == suffix[16] == '-'
+            and suffix[10] == '_'
+            and (suffix[0:4] + suffix[5:7] + suffix[8:10]
+                 + suffix[11:13] + suffix[14:16] + suffix[17:19]).isdecimal())
+
+# Backup filenames are parsed again on every rescan and prune, so results are
+# memoized. BackupViewModel clears the cache when a new folder is scanned.
+@lru_cache(maxsize=4096)
+def _parse_backup_filename(backup_filename: str) -> str | None:
+    """
+    Splits the original save filename off a backup filename string. Common
+    names are split on the last ".save_"; the rest fall back to a
+    case-insensitive regular expression. Both check the timestamp.
+    """
+    # Fast path for the usual lowercase ".save_" separator, which avoids
+    # running the regular expression.
+    base, separator, suffix = backup_filename.rpartition('.save_')
+    if separator and _is_backup_suffix(suffix):
+        return base + '.save'
+
+    # Anything else (e.g. ".SAVE_") gets the full case-insensitive match.
+    match = _BACKUP_RE.match(backup_filename)
+    return match.group(1) if match else None
+
+def clear_backup_filename_cache():
+    """Forgets the memoized results of get_original_from_backup."""
+    _parse_backup_filename.cache_clear()
 
 def get_original_from_backup(backup_filename: str) -> str | None:
     """
-    Parses a backup filename to get the original .save filename using a robust
-    regular expression that is case-insensitive and handles the timestamp.
+    Parses a backup filename to get the original .save filename.
     e.g., "slot_00000002.save_2023-10-27_10-30-00.bak" -> "slot_00000002.save"
     e.g., "slot_00000002.save_2023-10-27_10-30-00.zip" -> "slot_00000002.save"
 
@@ -19,18 +64,8 @@ def get_original_from_backup(backup_filename: str) -> str | None:
     Returns:
         The original save filename, or None if parsing fails.
     """
-    # Handle cases where the input is None or not a string
+    # Handle cases where the input is None or not a string. This is checked
+    # before the cache, which cannot hash every type.
     if not isinstance(backup_filename, str):
         return None
-    
-    # This regular expression looks for the following pattern:
-    #   (.+)       - Group 1: Captures the original filename (e.g., "Slot_00000002.save").
-    #              - The `.+` is greedy but will stop at the underscore before the date.
-    #   _          - A literal underscore separating the name from the timestamp.
-    #   (\d{4}...) - A group matching the specific timestamp format (YYYY-MM-DD_HH-MM-SS).
-    #   \.(bak|zip)$ - The literal string ".bak" or ".zip" at the end of the filename.
-    #   re.IGNORECASE makes the match work for both "Slot" and "slot", etc.
-    match = re.match(r'(.*?\.save)_(\d{4}-\d{2}-\d{2}_\d{2}-\d{2}-\d{2})\.(bak|zip)$', backup_filename, re.IGNORECASE)
-    if match:
-        return match.group(1)
-    return None
\ No newline at end of file
+    return _parse_backup_filename(backup_filename)